@@ -0,0 +1,37 @@
+"""Time repeated calls of :func:`petsctools.cite`.
+
+Solver code often calls ``cite`` each time a preconditioner is set up or
+applied, so after the first call it should cost little more than a
+Python function call. Run with::
+
+    python benchmarks/cite.py
+"""
+
+import timeit
+
+import petsctools
+
+NUMBER = 100_000
+
+
+def noop(cite_key):
+    pass
+
+
+def main():
+    petsctools.init([])
+    petsctools.add_citation(
+        "Benchmark2026", "@misc{Benchmark2026, title={A benchmark}}"
+    )
+    petsctools.cite("Benchmark2026")
+
+    for name, func in (("cite", petsctools.cite), ("no-op", noop)):
+        timer = timeit.Timer(
+            "func('Benchmark2026')", globals={"func": func}
+        )
+        best = min(timer.repeat(repeat=5, number=NUMBER)) / NUMBER
+        print(f"{name}: {best * 1e9:.0f} ns per call")
+
+
+if __name__ == "__main__":
+    main()
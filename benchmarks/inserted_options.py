@@ -0,0 +1,45 @@
+"""Time entering and leaving :func:`petsctools.inserted_options`.
+
+This measures the per-call overhead of looking up the
+:class:`petsctools.OptionsManager` attached to a KSP and inserting its
+parameters. Run with::
+
+    python benchmarks/inserted_options.py
+"""
+
+import timeit
+
+import petsctools
+
+NUMBER = 10_000
+NPARAMETERS = 5
+
+
+def enter_and_exit(ksp):
+    with petsctools.inserted_options(ksp):
+        pass
+
+
+def main():
+    PETSc = petsctools.init([])
+    ksp = PETSc.KSP().create(comm=PETSc.COMM_SELF)
+    petsctools.set_from_options(
+        ksp,
+        parameters={f"opt{i}": i for i in range(NPARAMETERS)},
+        options_prefix="bench",
+    )
+
+    timer = timeit.Timer(
+        "enter_and_exit(ksp)",
+        globals={"enter_and_exit": enter_and_exit, "ksp": ksp},
+    )
+    best = min(timer.repeat(repeat=5, number=NUMBER)) / NUMBER
+    print(
+        f"inserted_options with {NPARAMETERS} parameters: "
+        f"{best * 1e6:.1f} us per call"
+    )
+    ksp.destroy()
+
+
+if __name__ == "__main__":
+    main()
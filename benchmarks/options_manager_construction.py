@@ -0,0 +1,37 @@
+"""Time the construction of :class:`petsctools.OptionsManager`.
+
+Each manager is constructed from the same parameters and then
+destroyed, so this measures the cost of creating a manager for a
+solver. Run with::
+
+    python benchmarks/options_manager_construction.py
+"""
+
+import timeit
+
+import petsctools
+
+NUMBER = 10_000
+NPARAMETERS = 20
+
+
+def main():
+    petsctools.init([])
+    parameters = {f"opt{i}": i for i in range(NPARAMETERS)}
+
+    timer = timeit.Timer(
+        "OptionsManager(parameters, options_prefix='bench')",
+        globals={
+            "OptionsManager": petsctools.OptionsManager,
+            "parameters": parameters,
+        },
+    )
+    best = min(timer.repeat(repeat=5, number=NUMBER)) / NUMBER
+    print(
+        f"OptionsManager with {NPARAMETERS} parameters: "
+        f"{best * 1e6:.1f} us per construction"
+    )
+
+
+if __name__ == "__main__":
+    main()
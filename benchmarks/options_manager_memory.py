@@ -0,0 +1,40 @@
+"""Measure the memory used by many :class:`petsctools.OptionsManager`.
+
+Block-structured and ensemble applications may create a manager for
+each of tens of thousands of solvers. This constructs the managers from
+the same parameters and reports the memory allocated per manager. Run
+with::
+
+    python benchmarks/options_manager_memory.py
+"""
+
+import gc
+import tracemalloc
+
+import petsctools
+
+NMANAGERS = 100_000
+NPARAMETERS = 5
+
+
+def main():
+    petsctools.init([])
+    parameters = {f"opt{i}": i for i in range(NPARAMETERS)}
+
+    gc.collect()
+    tracemalloc.start()
+    managers = [
+        petsctools.OptionsManager(parameters, default_prefix="bench")
+        for _ in range(NMANAGERS)
+    ]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{len(managers)} OptionsManagers with {NPARAMETERS} parameters: "
+        f"{current / 2**20:.1f} MiB, {current / NMANAGERS:.0f} B each"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import numpy
+from petsc4py import PETSc
+
+from petsctools cimport cpetsc, cutils
+
+
+def check_vec():
+    cdef cpetsc.PetscScalar[::1] array
+    cdef const cpetsc.PetscScalar[::1] array_read
+
+    vec = PETSc.Vec().createSeq(4, comm=PETSc.COMM_SELF)
+    vec.set(1)
+    array = cutils.vec_get_array(vec)
+    array[0] = 2
+    cutils.vec_restore_array(vec)
+    array_read = cutils.vec_get_array_read(vec)
+    assert array_read.shape[0] == 4 and array_read[0] == 2
+    cutils.vec_restore_array_read(vec)
+
+    # Empty vectors give empty views
+    empty = PETSc.Vec().createSeq(0, comm=PETSc.COMM_SELF)
+    array = cutils.vec_get_array_write(empty)
+    assert array.shape[0] == 0
+    cutils.vec_restore_array_write(empty)
+
+
+def check_section():
+    N = 10
+    section = PETSc.Section().create(comm=PETSc.COMM_SELF)
+    section.setChart(0, N)
+    dofs = numpy.zeros(N, dtype=PETSc.IntType)
+    dofs[::2] = 1
+    cutils.section_set_dofs(section, dofs)
+    cutils.section_set_constraint_dofs(section, dofs)
+    section.setUp()
+    assert (numpy.asarray(cutils.section_get_dofs(section)) == dofs).all()
+    assert (
+        numpy.asarray(cutils.section_get_constraint_dofs(section)) == dofs
+    ).all()
+
+    offsets = numpy.arange(N, dtype=PETSc.IntType)
+    cutils.section_set_offsets(section, offsets)
+    assert (
+        numpy.asarray(cutils.section_get_offsets(section)) == offsets
+    ).all()
+
+    # An empty chart gives an empty array
+    empty = PETSc.Section().create(comm=PETSc.COMM_SELF)
+    empty.setChart(0, 0)
+    assert cutils.section_get_dofs(empty).shape[0] == 0
+
+
+def check_sf():
+    sf = PETSc.SF().create(comm=PETSc.COMM_SELF)
+    ilocal = numpy.array([0, 2], dtype=PETSc.IntType)
+    iremote_rank = numpy.zeros(2, dtype=PETSc.IntType)
+    iremote_index = numpy.array([1, 0], dtype=PETSc.IntType)
+    cutils.sf_set_graph(sf, 3, ilocal, iremote_rank, iremote_index)
+
+    nroots, ilocal_, iremote_rank_, iremote_index_ = cutils.sf_get_graph(sf)
+    assert nroots == 3
+    assert (numpy.asarray(ilocal_) == ilocal).all()
+    assert (numpy.asarray(iremote_rank_) == iremote_rank).all()
+    assert (numpy.asarray(iremote_index_) == iremote_index).all()
+    # The views alias the storage of the star forest so are read-only
+    assert not numpy.asarray(iremote_index_).flags.writeable
+
+    # An empty graph gives empty arrays
+    empty = PETSc.SF().create(comm=PETSc.COMM_SELF)
+    cutils.sf_set_graph(empty, 0, None, ilocal[:0], ilocal[:0])
+    _, ilocal_, iremote_rank_, iremote_index_ = cutils.sf_get_graph(empty)
+    assert len(iremote_rank_) == len(iremote_index_) == 0
+
+
+def check_mat():
+    rows = numpy.array([0, 0, 1, 2, 2, 2], dtype=PETSc.IntType)
+    cols = numpy.array([0, 1, 1, 0, 2, 2], dtype=PETSc.IntType)
+    values = numpy.array([1, 2, 3, 4, 5, 6], dtype=PETSc.ScalarType)
+    expected = numpy.array([[1, 2, 0], [0, 3, 0], [4, 0, 11]])
+
+    mat = PETSc.Mat().createAIJ((3, 3), comm=PETSc.COMM_SELF)
+    cutils.mat_set_preallocation_coo(mat, rows, cols)
+    cutils.mat_set_values_coo(mat, values, cpetsc.ADD_VALUES)
+    assert (mat.getValues(range(3), range(3)) == expected).all()
+
+    mat = PETSc.Mat().createAIJ((3, 3), comm=PETSc.COMM_SELF)
+    mat.setUp()
+    cutils.mat_set_values_triplets(
+        mat, rows, cols, values, cpetsc.ADD_VALUES
+    )
+    mat.assemble()
+    assert (mat.getValues(range(3), range(3)) == expected).all()
+
+
+check_vec()
+check_section()
+check_sf()
+check_mat()
@@ -0,0 +1,63 @@
+from petsc4py import PETSc
+
+import petsctools
+from petsctools cimport cpetsc, cutils
+
+
+class JacobiPC(petsctools.PCBase):
+    prefix = "jacobi_"
+
+    def initialize(self, pc):
+        _, P = pc.getOperators()
+        self.diag = P.getDiagonal()
+
+    def update(self, pc):
+        _, P = pc.getOperators()
+        P.getDiagonal(self.diag)
+
+    def apply(self, pc, x, y):
+        cdef Py_ssize_t i
+        cdef const cpetsc.PetscScalar[::1] x_array, diag_array
+        cdef cpetsc.PetscScalar[::1] y_array
+
+        x_array = cutils.vec_get_array_read(x)
+        diag_array = cutils.vec_get_array_read(self.diag)
+        y_array = cutils.vec_get_array_write(y)
+        for i in range(y_array.shape[0]):
+            y_array[i] = x_array[i] / diag_array[i]
+        cutils.vec_restore_array_write(y)
+        cutils.vec_restore_array_read(self.diag)
+        cutils.vec_restore_array_read(x)
+
+
+def solve():
+    N = int(1e6)
+    diag = PETSc.Vec().createSeq(N)
+    diag.setRandom()
+    diag.shift(1)
+    mat = PETSc.Mat().createDiagonal(diag)
+
+    ksp = PETSc.KSP().create(comm=PETSc.COMM_SELF)
+    ksp.setOperators(mat)
+    petsctools.set_from_options(
+        ksp,
+        parameters={
+            "ksp_type": "preonly",
+            "pc_type": "python",
+            "pc_python_type": "jacobi.JacobiPC",
+        },
+        options_prefix="demo",
+    )
+
+    x, b = mat.createVecs()
+    b.setRandom()
+    with petsctools.inserted_options(ksp):
+        ksp.solve(b, x)
+
+    mat.mult(x, diag)
+    diag.axpy(-1, b)
+    print(f"Residual norm: {diag.norm()}")
+
+
+petsctools.init()
+solve()
@@ -3,17 +3,20 @@ from setuptools import Extension, setup
 
 import petsctools
 
-extension = Extension(
-    name="fast",
-    language="c",
-    sources=["fast.pyx"],
-    include_dirs=[
-        petsc4py.get_include(),
-        *petsctools.get_petsc_dirs(subdir="include"),
-    ],
-    library_dirs=petsctools.get_petsc_dirs(subdir="lib"),
-    runtime_library_dirs=petsctools.get_petsc_dirs(subdir="lib"),
-    libraries=["petsc", "mpi"],
-)
+extensions = [
+    Extension(
+        name=name,
+        language="c",
+        sources=[f"{name}.pyx"],
+        include_dirs=[
+            petsc4py.get_include(),
+            *petsctools.get_petsc_dirs(subdir="include"),
+        ],
+        library_dirs=petsctools.get_petsc_dirs(subdir="lib"),
+        runtime_library_dirs=petsctools.get_petsc_dirs(subdir="lib"),
+        libraries=["petsc", "mpi"],
+    )
+    for name in ["fast", "jacobi", "helpers"]
+]
 
-setup(ext_modules=[extension])
+setup(ext_modules=extensions)
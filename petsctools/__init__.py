@@ -24,37 +24,61 @@ if PETSC4PY_INSTALLED:
         AppContextManager,
         PetscToolsAppctxException,
     )
+    from .autotune import autotune, load_autotune_results  # noqa: F401
+    from .cache import ObjectCache  # noqa: F401
     from .citation import (  # noqa: F401
         add_citation,
+        add_citation_file,
         cite,
+        cite_many,
         print_citations_at_exit,
     )
     from .config import get_blas_library  # noqa: F401
-    from .init import init  # noqa: F401
+    from .init import get_init_profile, init  # noqa: F401
+    from .mat import (  # noqa: F401
+        MatBase,
+        get_coo_preallocation,
+        set_values_coo,
+    )
     from .options import (  # noqa: F401
         DefaultOptionSet,
         OptionsManager,
+        OptionsMonitor,
         attach_options,
         flatten_parameters,
         get_commandline_options,
         get_options,
+        get_options_monitor,
         has_options,
         inserted_options,
         is_set_from_options,
+        monitor_options,
         petscobj2str,
+        recycle_default_prefixes,
+        report_unused_options,
+        report_unused_options_at_exit,
         set_default_parameter,
         set_from_options,
+        use_log_stages,
     )
     from .pc import PCBase  # noqa: F401
 else:
 
     def __getattr__(name):
         petsc4py_attrs = {
+            "autotune",
+            "load_autotune_results",
+            "ObjectCache",
             "add_citation",
+            "add_citation_file",
             "cite",
+            "cite_many",
             "print_citations_at_exit",
             "get_blas_library",
             "init",
+            "get_init_profile",
+            "get_coo_preallocation",
+            "set_values_coo",
             "flatten_parameters",
             "get_commandline_options",
             "OptionsManager",
@@ -67,7 +91,15 @@ else:
             "inserted_options",
             "set_default_parameter",
             "DefaultOptionSet",
+            "report_unused_options",
+            "report_unused_options_at_exit",
+            "recycle_default_prefixes",
+            "OptionsMonitor",
+            "monitor_options",
+            "get_options_monitor",
+            "use_log_stages",
             "PCBase",
+            "MatBase",
             "AppContext",
             "AppContextManager",
             "PetscToolsAppctxException",
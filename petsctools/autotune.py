@@ -0,0 +1,200 @@
+"""Choose between solver configurations by timing them."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import math
+import warnings
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import petsc4py
+
+from petsctools.exceptions import PetscToolsException, PetscToolsWarning
+from petsctools.log import get_log_event, reduce_timings
+from petsctools.options import (
+    flatten_parameters,
+    inserted_options,
+    set_from_options,
+)
+
+
+def autotune(
+    factory: Callable[[petsc4py.PETSc.Comm], petsc4py.PETSc.Object],
+    candidates: Iterable[dict],
+    workload: Callable[[petsc4py.PETSc.Object], Any],
+    *,
+    comm: petsc4py.PETSc.Comm | None = None,
+    repeats: int = 1,
+    nsubcomms: int = 1,
+    filename: str | None = None,
+) -> list[tuple[float, dict]]:
+    """Time a workload with each of a set of solver configurations.
+
+    For every candidate set of parameters, and for each repeat, a new
+    object is created by ``factory``, configured with
+    :func:`set_from_options` and then passed to ``workload`` inside
+    :func:`inserted_options`. Each call of ``workload`` is logged with a
+    PETSc log event named ``"petsctools_autotune_{i}"``, where ``i`` is the
+    index of the candidate, so the candidates can be compared in
+    ``-log_view``.
+
+    Parameters
+    ----------
+    factory
+        Function taking a communicator and returning a new, unconfigured,
+        PETSc object, for example a KSP with its operators set.
+    candidates
+        The parameter dictionaries to try. Nested dictionaries are
+        flattened with :func:`flatten_parameters`.
+    workload
+        Function taking the configured object and performing the work to
+        be timed, for example calling ``ksp.solve``.
+    comm
+        The communicator to run on. Defaults to ``PETSc.COMM_WORLD``.
+    repeats
+        The number of times to run each candidate. The fastest run is
+        used.
+    nsubcomms
+        The number of sub-communicators to split ``comm`` into. Each
+        sub-communicator evaluates a different subset of the candidates
+        at the same time. Requires mpi4py if greater than one.
+    filename
+        If provided, the results are written to this file as JSON by rank
+        0 of ``comm``.
+
+    Returns
+    -------
+        List of ``(time, parameters)`` pairs, fastest first, where
+        ``time`` is the maximum time over the ranks evaluating the
+        candidate and ``parameters`` is the flattened candidate. Candidates
+        that raise a ``PETSc.Error`` are given an infinite time.
+
+    Notes
+    -----
+    This function is collective over ``comm``. ``factory`` and
+    ``workload`` are called collectively over the (sub-)communicator, so
+    any errors must also be raised collectively.
+    """
+    from petsc4py import PETSc
+
+    if comm is None:
+        comm = PETSc.COMM_WORLD
+    if repeats < 1:
+        raise ValueError(f"repeats must be at least 1, not {repeats}")
+    if not 1 <= nsubcomms <= comm.getSize():
+        raise ValueError(
+            f"nsubcomms must be between 1 and the size of the communicator"
+            f" ({comm.getSize()}), not {nsubcomms}"
+        )
+
+    candidates = [flatten_parameters(c) for c in candidates]
+
+    if nsubcomms == 1:
+        times = {
+            i: _time_candidate(factory, parameters, workload, comm, repeats,
+                               f"petsctools_autotune_{i}")
+            for i, parameters in enumerate(candidates)
+        }
+    else:
+        with _split_comm(comm, nsubcomms) as (subcomm, color):
+            local_times = {
+                i: _time_candidate(factory, candidates[i], workload, subcomm,
+                                   repeats, f"petsctools_autotune_{i}")
+                for i in range(color, len(candidates), nsubcomms)
+            }
+        times = {}
+        for subcomm_times in comm.tompi4py().allgather(local_times):
+            times.update(subcomm_times)
+
+    results = sorted(
+        ((times[i], parameters) for i, parameters in enumerate(candidates)),
+        key=lambda result: result[0],
+    )
+    if filename is not None and comm.getRank() == 0:
+        with open(filename, "w") as f:
+            json.dump(
+                [
+                    {"time": time, "parameters": parameters}
+                    for time, parameters in results
+                ],
+                f,
+                indent=2,
+            )
+    return results
+
+
+def load_autotune_results(filename: str) -> list[tuple[float, dict]]:
+    """Read results written by :func:`autotune`.
+
+    Parameters
+    ----------
+    filename
+        The file passed to :func:`autotune`.
+
+    Returns
+    -------
+        List of ``(time, parameters)`` pairs, fastest first.
+    """
+    with open(filename) as f:
+        try:
+            results = json.load(f)
+            return [
+                (result["time"], result["parameters"]) for result in results
+            ]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise PetscToolsException(
+                f"{filename} does not contain autotuning results"
+            ) from e
+
+
+@contextlib.contextmanager
+def _split_comm(comm, nsubcomms):
+    """Split a communicator into interleaved sub-communicators.
+
+    Yields the sub-communicator containing this rank and its index.
+    """
+    from petsc4py import PETSc
+
+    mpi_comm = comm.tompi4py()
+    color = mpi_comm.Get_rank() % nsubcomms
+    # PETSc does not own the split communicator so it must be freed here
+    # rather than destroyed through PETSc
+    mpi_subcomm = mpi_comm.Split(color)
+    try:
+        yield PETSc.Comm(mpi_subcomm), color
+    finally:
+        mpi_subcomm.Free()
+
+
+def _time_candidate(factory, parameters, workload, comm, repeats, name):
+    """Return the fastest time of a candidate over a number of repeats."""
+    from petsc4py import PETSc
+
+    event = get_log_event(name)
+    best = math.inf
+    for _ in range(repeats):
+        obj = factory(comm)
+        try:
+            set_from_options(
+                obj, parameters, default_prefix="petsctools_autotune_"
+            )
+            with inserted_options(obj):
+                start = PETSc.Log.getTime()
+                event.begin()
+                try:
+                    workload(obj)
+                finally:
+                    event.end()
+                elapsed = PETSc.Log.getTime() - start
+        except PETSc.Error as e:
+            warnings.warn(
+                f"Autotuning candidate {parameters} failed: {e}",
+                PetscToolsWarning,
+            )
+            return math.inf
+        finally:
+            obj.destroy()
+        best = min(best, elapsed)
+    return reduce_timings({name: best}, comm)[name]["max"]
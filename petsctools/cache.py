@@ -0,0 +1,126 @@
+"""Reuse of configured PETSc objects."""
+
+from __future__ import annotations
+
+import collections
+from collections.abc import Callable
+
+import petsc4py
+
+from petsctools.options import flatten_parameters, set_from_options
+
+
+class ObjectCache:
+    """A least recently used cache of configured PETSc objects.
+
+    Creating a solver and calling ``setFromOptions`` and ``setUp`` can be
+    a significant cost for short solves. This cache hands back an object
+    that was already configured with the same parameters, so that
+    repeated solves skip the reconfiguration.
+
+    Objects are identified by their type, communicator, (flattened)
+    parameters and options prefix. When the cache is full the least
+    recently used object is destroyed.
+
+    Parameters
+    ----------
+    maxsize
+        The maximum number of objects to keep.
+
+    Notes
+    -----
+    A cached object is shared between all callers with the same key, and
+    it keeps the state from its previous use (e.g. its operators). Only
+    use the cache for objects that are used one at a time, and reset any
+    state that differs between uses.
+
+    Examples
+    --------
+    .. code-block:: python3
+
+        cache = ObjectCache(maxsize=4)
+        ksp = cache.get(
+            PETSc.KSP, PETSc.COMM_WORLD, {"ksp_type": "cg"},
+            setup=lambda ksp: ksp.setOperators(A),
+        )
+    """
+
+    def __init__(self, maxsize: int = 16):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, not {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._objects = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._objects)
+
+    def get(
+        self,
+        obj_type: type[petsc4py.PETSc.Object],
+        comm: petsc4py.PETSc.Comm,
+        parameters: dict | None = None,
+        options_prefix: str | None = None,
+        setup: Callable[[petsc4py.PETSc.Object], None] | None = None,
+    ) -> petsc4py.PETSc.Object:
+        """Return a configured object, creating it if needed.
+
+        Parameters
+        ----------
+        obj_type
+            The type of PETSc object, e.g. ``PETSc.KSP``.
+        comm
+            The communicator of the object.
+        parameters
+            The parameters to configure the object with.
+        options_prefix
+            The options prefix of the object.
+        setup
+            Function called with a newly created object before
+            :func:`set_from_options`, e.g. to set the operators. It is not
+            called for cached objects.
+
+        Returns
+        -------
+            The object, with an :class:`OptionsManager` attached and
+            ``setFromOptions`` already called.
+        """
+        parameters = flatten_parameters(parameters or {})
+        # Values are keyed by their string form, as in the options database
+        key = (
+            obj_type,
+            comm.fortran,
+            frozenset((k, str(v)) for k, v in parameters.items()),
+            options_prefix,
+        )
+        try:
+            obj = self._objects[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self._objects.move_to_end(key)
+            return obj
+
+        self.misses += 1
+        obj = obj_type().create(comm=comm)
+        try:
+            if setup is not None:
+                setup(obj)
+            set_from_options(obj, parameters, options_prefix=options_prefix)
+        except BaseException:
+            obj.destroy()
+            raise
+
+        self._objects[key] = obj
+        while len(self._objects) > self.maxsize:
+            _, evicted = self._objects.popitem(last=False)
+            evicted.destroy()
+        return obj
+
+    def clear(self) -> None:
+        """Destroy all of the cached objects."""
+        while self._objects:
+            _, obj = self._objects.popitem(last=False)
+            obj.destroy()
@@ -15,12 +15,30 @@ Example usage::
     if using_funky_method:
         petsctools.cite("key")
 
+Large numbers of citations may instead be read lazily from a BibTeX file
+using `add_citation_file`, in which case the file is only read once one of
+its entries is cited.
+
+Calling `cite` repeatedly (for example every time a preconditioner is
+applied) is cheap since each citation is only registered with PETSc once.
+
 """
 
+import functools
+import os
+import re
+from collections.abc import Callable, Iterable
+
 _citations_database = {}
 
+_citation_files = []
+"""BibTeX files that have been added but not yet read."""
 
-def add_citation(cite_key: str, entry: str) -> None:
+_registered_citations = set()
+"""The keys of the citations that have already been registered with PETSc."""
+
+
+def add_citation(cite_key: str, entry: str | Callable[[], str]) -> None:
     """Add a paper to the database of possible citations.
 
     Parameters
@@ -28,17 +46,134 @@ def add_citation(cite_key: str, entry: str) -> None:
     cite_key :
         The key to use.
     entry :
-        The bibtex entry.
+        The bibtex entry. This may also be a function taking no arguments
+        that returns the bibtex entry, in which case it is only called the
+        first time that the paper is cited.
 
     """
     _citations_database[cite_key] = entry
+    # The entry may have changed so make sure it is registered again
+    _registered_citations.discard(cite_key)
+
+
+def add_citation_file(
+    path: str | os.PathLike, cite_keys: Iterable[str] | None = None
+) -> None:
+    """Add the papers in a BibTeX file to the database of possible citations.
+
+    The file is not read until one of its papers is cited.
+
+    Parameters
+    ----------
+    path :
+        The path to the BibTeX file.
+    cite_keys :
+        The keys of the entries in the file. If provided, the file is only
+        read when one of these keys is cited. Otherwise the file is read the
+        first time that a key missing from the database is cited.
+
+    """
+    if cite_keys is None:
+        _citation_files.append(path)
+    else:
+        for cite_key in cite_keys:
+            add_citation(
+                cite_key, functools.partial(_load_citation, path, cite_key)
+            )
+
+
+def _load_citation(path: str | os.PathLike, cite_key: str) -> str:
+    """Return a single entry from a BibTeX file."""
+    entries = _read_citation_file(path)
+    if cite_key not in entries:
+        raise KeyError(f"Did not find a citation for '{cite_key}' in {path}")
+
+    # Avoid reading the file again for any other keys it provides
+    for key, entry in entries.items():
+        loader = _citations_database.get(key)
+        if (
+            isinstance(loader, functools.partial)
+            and loader.func is _load_citation
+            and loader.args == (path, key)
+        ):
+            _citations_database[key] = entry
+    return entries[cite_key]
+
+
+_bibtex_entry_header = re.compile(
+    r"^[ \t]*@[ \t]*(\w+)[ \t]*([{(])", re.MULTILINE
+)
+"""Matches the start of a BibTeX entry, e.g. ``@article{``."""
+
+
+def _read_citation_file(path: str | os.PathLike) -> dict[str, str]:
+    """Return the entries in a BibTeX file, indexed by key.
+
+    As for BibTeX, any text outside of an entry is ignored.
+    """
+    with open(path) as f:
+        text = f.read()
+
+    entries = {}
+    header = _bibtex_entry_header.search(text)
+    while header is not None:
+        start = text.index("@", header.start())
+        opening = header.start(2)
+        closing = "}" if header.group(2) == "{" else ")"
+        # Find the closing delimiter outside of any braces
+        depth = 0
+        for match in re.compile("[{}()]").finditer(text, opening + 1):
+            char = match.group()
+            if char == "{":
+                depth += 1
+            elif char == "}" and depth > 0:
+                depth -= 1
+            elif char == closing and depth == 0:
+                break
+        else:
+            raise ValueError(
+                f"Unterminated BibTeX entry starting '{text[start:opening+1]}'"
+                f" in {path}"
+            )
+        end = match.end()
+        if header.group(1).lower() not in {"comment", "preamble", "string"}:
+            comma = text.find(",", opening, end)
+            if comma == -1:
+                raise ValueError(
+                    f"BibTeX entry '{text[start:end]}' in {path} does not "
+                    "have a key"
+                )
+            cite_key = text[opening+1:comma].strip()
+            entries[cite_key] = text[start:end]
+        header = _bibtex_entry_header.search(text, end)
+    return entries
+
+
+def _get_citation(cite_key: str) -> str:
+    """Return the bibtex entry for a key, loading it if necessary."""
+    while cite_key not in _citations_database and _citation_files:
+        for key, entry in _read_citation_file(_citation_files.pop(0)).items():
+            _citations_database.setdefault(key, entry)
+
+    try:
+        entry = _citations_database[cite_key]
+    except KeyError:
+        raise KeyError(
+            f"Did not find a citation for '{cite_key}', please add it to the "
+            "citations database"
+        )
+    if callable(entry):
+        entry = entry()
+        _citations_database[cite_key] = entry
+    return entry
 
 
 def cite(cite_key: str) -> None:
     """Cite a paper.
 
     The paper should already have been added to the citations database using
-    `add_citation`.
+    `add_citation` or `add_citation_file`. Citing the same paper more than
+    once is cheap because each citation is only registered with PETSc once.
 
     Parameters
     ----------
@@ -50,17 +185,37 @@ def cite(cite_key: str) -> None:
     KeyError :
         If no such citation is found in the database.
 
+    """
+    if cite_key not in _registered_citations:
+        cite_many([cite_key])
+
+
+def cite_many(cite_keys: Iterable[str]) -> None:
+    """Cite a number of papers.
+
+    Parameters
+    ----------
+    cite_keys :
+        The keys of the relevant citations.
+
+    Raises
+    ------
+    KeyError :
+        If any of the citations are not found in the database. In this case
+        none of the citations are registered.
+
     """
     from petsc4py import PETSc
 
-    if cite_key in _citations_database:
-        citation = _citations_database[cite_key]
-        PETSc.Sys.registerCitation(citation)
-    else:
-        raise KeyError(
-            f"Did not find a citation for '{cite_key}', please add it to the "
-            "citations database"
-        )
+    cite_keys = [
+        cite_key for cite_key in dict.fromkeys(cite_keys)
+        if cite_key not in _registered_citations
+    ]
+    entries = [_get_citation(cite_key) for cite_key in cite_keys]
+
+    for cite_key, entry in zip(cite_keys, entries):
+        PETSc.Sys.registerCitation(entry)
+        _registered_citations.add(cite_key)
 
 
 def print_citations_at_exit() -> None:
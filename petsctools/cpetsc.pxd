@@ -13,6 +13,10 @@ ctypedef _PETSc.PetscSection PetscSection
 ctypedef _PETSc.Section PetscSection_py
 ctypedef _PETSc.PetscIS IS
 ctypedef _PETSc.IS IS_py
+ctypedef _PETSc.PetscVec Vec
+ctypedef _PETSc.Vec Vec_py
+ctypedef _PETSc.PetscPC PC
+ctypedef _PETSc.PC PC_py
 
 # other PETSc imports
 from petsc4py.PETSc cimport (
@@ -23,6 +27,7 @@ from petsc4py.PETSc cimport (
 
 cdef extern from "petscsystypes.h":
     ctypedef long PetscInt
+    ctypedef long PetscCount
     ctypedef double PetscReal
     ctypedef double PetscScalar
     ctypedef enum PetscBool:
@@ -42,9 +47,24 @@ cdef extern from "petscsys.h":
     PetscErrorCode PetscMalloc1(size_t,void*)
     PetscErrorCode PetscFree(void*)
 
+# Vec
+cdef extern from "petscvec.h":
+    PetscErrorCode VecGetSize(Vec,PetscInt*)
+    PetscErrorCode VecGetLocalSize(Vec,PetscInt*)
+    PetscErrorCode VecGetOwnershipRange(Vec,PetscInt*,PetscInt*)
+    PetscErrorCode VecGetArray(Vec,PetscScalar*[])
+    PetscErrorCode VecRestoreArray(Vec,PetscScalar*[])
+    PetscErrorCode VecGetArrayRead(Vec,const PetscScalar*[])
+    PetscErrorCode VecRestoreArrayRead(Vec,const PetscScalar*[])
+    PetscErrorCode VecGetArrayWrite(Vec,PetscScalar*[])
+    PetscErrorCode VecRestoreArrayWrite(Vec,PetscScalar*[])
+
 # Mat
 cdef extern from "petscmat.h":
     PetscErrorCode MatSetValue(Mat,PetscInt,PetscInt,const PetscScalar,InsertMode)
+    PetscErrorCode MatSetValues(Mat,PetscInt,const PetscInt[],PetscInt,const PetscInt[],const PetscScalar[],InsertMode)
+    PetscErrorCode MatSetPreallocationCOO(Mat,PetscCount,PetscInt[],PetscInt[])
+    PetscErrorCode MatSetValuesCOO(Mat,const PetscScalar[],InsertMode)
     PetscErrorCode MatSetValuesBlockedLocal(Mat,PetscInt,const PetscInt[],PetscInt,const PetscInt[],const PetscScalar[],InsertMode)
 
 # PetscSF
@@ -58,6 +78,7 @@ cdef extern from "petscsf.h":
 
 # PetscSection
 cdef extern from "petscsection.h":
+    PetscErrorCode PetscSectionGetChart(PetscSection,PetscInt*,PetscInt*)
     PetscErrorCode PetscSectionGetDof(PetscSection,PetscInt,PetscInt*)
     PetscErrorCode PetscSectionSetDof(PetscSection,PetscInt,PetscInt)
     PetscErrorCode PetscSectionGetOffset(PetscSection,PetscInt,PetscInt*)
@@ -0,0 +1,364 @@
+"""This file provides inline helper functions built on top of cpetsc."""
+
+# IMPORTANT: This file cannot be accessed if petsctools is installed in
+# editable mode.
+
+from cython cimport view
+from libc.stdlib cimport free, malloc
+
+from petsctools cimport cpetsc
+from petsctools.cpetsc cimport (
+    CHKERR,
+    InsertMode,
+    PetscCount,
+    PetscErrorCode,
+    PetscInt,
+    PetscScalar,
+    PetscSection,
+)
+
+
+cdef inline void *_malloc(size_t size) except NULL:
+    cdef void *data = malloc(size)
+    if data == NULL:
+        raise MemoryError()
+    return data
+
+
+cdef inline PetscScalar[::1] _scalar_view(PetscScalar *data, PetscInt n):
+    # Wrap an array without copying it
+    cdef view.array empty
+
+    if n == 0:
+        # Cython cannot create zero-sized arrays from a pointer so allocate
+        # a single entry instead. Casting (rather than using view.array
+        # directly) gives the buffer format of PetscScalar, which may be
+        # complex.
+        empty = <PetscScalar[:1]> <PetscScalar *> _malloc(sizeof(PetscScalar))
+        empty.callback_free_data = free
+        return empty[:0]
+    return <PetscScalar[:n]> data
+
+
+cdef inline PetscInt[::1] _int_view(PetscInt *data, PetscInt n):
+    # Wrap an array without copying it
+    if n == 0:
+        return _new_int_array(0)
+    return <PetscInt[:n]> data
+
+
+cdef inline PetscInt[::1] _new_int_array(PetscInt n):
+    # Cython cannot create zero-sized arrays so allocate at least one entry.
+    # Casting (rather than using view.array directly) gives the buffer
+    # format of PetscInt, which may be 32 or 64 bits.
+    cdef PetscInt size = max(n, 1)
+    cdef view.array array
+
+    array = <PetscInt[:size]> <PetscInt *> _malloc(size * sizeof(PetscInt))
+    array.callback_free_data = free
+    return array[:n]
+
+
+cdef inline object _readonly(const PetscInt[:] values):
+    # Prevent writes to storage owned by PETSc
+    return memoryview(values).toreadonly()
+
+
+# Vec
+cdef inline PetscScalar[::1] vec_get_array(cpetsc.Vec_py vec):
+    """Return a view of the local entries of a vector.
+
+    The view must be released with ``vec_restore_array`` once it is no
+    longer needed.
+    """
+    cdef PetscInt n
+    cdef PetscScalar *data
+
+    CHKERR(cpetsc.VecGetLocalSize(vec.vec, &n))
+    CHKERR(cpetsc.VecGetArray(vec.vec, &data))
+    return _scalar_view(data, n)
+
+
+cdef inline void vec_restore_array(cpetsc.Vec_py vec):
+    """Release a view obtained with ``vec_get_array``."""
+    CHKERR(cpetsc.VecRestoreArray(vec.vec, NULL))
+
+
+cdef inline const PetscScalar[::1] vec_get_array_read(cpetsc.Vec_py vec):
+    """Return a read-only view of the local entries of a vector.
+
+    The view must be released with ``vec_restore_array_read`` once it is
+    no longer needed.
+    """
+    cdef PetscInt n
+    cdef const PetscScalar *data
+
+    CHKERR(cpetsc.VecGetLocalSize(vec.vec, &n))
+    CHKERR(cpetsc.VecGetArrayRead(vec.vec, &data))
+    return _scalar_view(<PetscScalar *> data, n)
+
+
+cdef inline void vec_restore_array_read(cpetsc.Vec_py vec):
+    """Release a view obtained with ``vec_get_array_read``."""
+    CHKERR(cpetsc.VecRestoreArrayRead(vec.vec, NULL))
+
+
+cdef inline PetscScalar[::1] vec_get_array_write(cpetsc.Vec_py vec):
+    """Return a write-only view of the local entries of a vector.
+
+    The existing values of the entries are undefined. The view must be
+    released with ``vec_restore_array_write`` once it is no longer needed.
+    """
+    cdef PetscInt n
+    cdef PetscScalar *data
+
+    CHKERR(cpetsc.VecGetLocalSize(vec.vec, &n))
+    CHKERR(cpetsc.VecGetArrayWrite(vec.vec, &data))
+    return _scalar_view(data, n)
+
+
+cdef inline void vec_restore_array_write(cpetsc.Vec_py vec):
+    """Release a view obtained with ``vec_get_array_write``."""
+    CHKERR(cpetsc.VecRestoreArrayWrite(vec.vec, NULL))
+
+
+# PetscSection
+ctypedef PetscErrorCode (*_PetscSectionSetter)(PetscSection,PetscInt,PetscInt)
+ctypedef PetscErrorCode (*_PetscSectionGetter)(PetscSection,PetscInt,PetscInt*)
+
+
+cdef inline void _section_set(
+    cpetsc.PetscSection_py section,
+    const PetscInt[::1] values,
+    _PetscSectionSetter setter,
+):
+    cdef PetscInt p, pstart, pend
+
+    CHKERR(cpetsc.PetscSectionGetChart(section.sec, &pstart, &pend))
+    if values.shape[0] != pend - pstart:
+        raise ValueError(
+            f"Expected {pend - pstart} values to match the section chart, "
+            f"not {values.shape[0]}"
+        )
+    for p in range(pstart, pend):
+        CHKERR(setter(section.sec, p, values[p-pstart]))
+
+
+cdef inline PetscInt[::1] _section_get(
+    cpetsc.PetscSection_py section,
+    _PetscSectionGetter getter,
+):
+    cdef PetscInt p, pstart, pend
+    cdef PetscInt[::1] values
+
+    CHKERR(cpetsc.PetscSectionGetChart(section.sec, &pstart, &pend))
+    values = _new_int_array(pend - pstart)
+    for p in range(pstart, pend):
+        CHKERR(getter(section.sec, p, &values[p-pstart]))
+    return values
+
+
+cdef inline void section_set_dofs(
+    cpetsc.PetscSection_py section, const PetscInt[::1] dofs
+):
+    """Set the number of DoFs for every point in the chart of a section.
+
+    ``dofs`` must have one entry per point in the chart.
+    """
+    _section_set(section, dofs, cpetsc.PetscSectionSetDof)
+
+
+cdef inline void section_set_offsets(
+    cpetsc.PetscSection_py section, const PetscInt[::1] offsets
+):
+    """Set the offset for every point in the chart of a section.
+
+    ``offsets`` must have one entry per point in the chart.
+    """
+    _section_set(section, offsets, cpetsc.PetscSectionSetOffset)
+
+
+cdef inline void section_set_constraint_dofs(
+    cpetsc.PetscSection_py section, const PetscInt[::1] dofs
+):
+    """Set the number of constrained DoFs for every point in the chart of a
+    section.
+
+    ``dofs`` must have one entry per point in the chart.
+    """
+    _section_set(section, dofs, cpetsc.PetscSectionSetConstraintDof)
+
+
+cdef inline PetscInt[::1] section_get_dofs(cpetsc.PetscSection_py section):
+    """Return a new array with the number of DoFs for every point in the
+    chart of a section.
+    """
+    return _section_get(section, cpetsc.PetscSectionGetDof)
+
+
+cdef inline PetscInt[::1] section_get_offsets(
+    cpetsc.PetscSection_py section
+):
+    """Return a new array with the offset for every point in the chart of a
+    section.
+    """
+    return _section_get(section, cpetsc.PetscSectionGetOffset)
+
+
+cdef inline PetscInt[::1] section_get_constraint_dofs(
+    cpetsc.PetscSection_py section
+):
+    """Return a new array with the number of constrained DoFs for every point
+    in the chart of a section.
+    """
+    return _section_get(section, cpetsc.PetscSectionGetConstraintDof)
+
+
+# PetscSF
+cdef inline void sf_set_graph(
+    cpetsc.PetscSF_py sf,
+    PetscInt nroots,
+    const PetscInt[::1] ilocal,
+    const PetscInt[:] iremote_rank,
+    const PetscInt[:] iremote_index,
+):
+    """Set the graph of a star forest.
+
+    ``ilocal`` gives the leaf indices and may be ``None`` if the leaves are
+    contiguous. ``iremote_rank`` and ``iremote_index`` give the rank and
+    index of the root connected to each leaf. The leaf indices are copied
+    and the remote roots are packed directly into storage owned by the
+    star forest.
+    """
+    cdef PetscInt i, nleaves = iremote_rank.shape[0]
+    cdef PetscInt *local = NULL
+    cdef cpetsc.PetscSFNode *remote = NULL
+
+    if iremote_index.shape[0] != nleaves:
+        raise ValueError(
+            "iremote_rank and iremote_index must have the same length"
+        )
+    if ilocal is not None and ilocal.shape[0] != nleaves:
+        raise ValueError("ilocal and iremote_rank must have the same length")
+
+    if ilocal is not None and nleaves > 0:
+        local = <PetscInt *> &ilocal[0]
+    CHKERR(cpetsc.PetscMalloc1(nleaves, &remote))
+    for i in range(nleaves):
+        remote[i].rank = iremote_rank[i]
+        remote[i].index = iremote_index[i]
+    CHKERR(
+        cpetsc.PetscSFSetGraph(
+            sf.sf, nroots, nleaves,
+            local, cpetsc.PETSC_COPY_VALUES,
+            remote, cpetsc.PETSC_OWN_POINTER,
+        )
+    )
+
+
+cdef inline tuple sf_get_graph(cpetsc.PetscSF_py sf):
+    """Return the graph of a star forest.
+
+    Returns a tuple ``(nroots, ilocal, iremote_rank, iremote_index)``
+    matching the arguments of ``sf_set_graph``. ``ilocal`` is ``None`` if
+    the leaves are contiguous. The arrays are read-only views of the
+    storage of the star forest and so must not be used once the graph is
+    changed or the star forest is destroyed.
+    """
+    cdef PetscInt nroots, nleaves
+    cdef const PetscInt *local = NULL
+    cdef const cpetsc.PetscSFNode *remote = NULL
+    cdef const PetscInt[:, ::1] iremote
+    cdef view.array empty
+
+    CHKERR(cpetsc.PetscSFGetGraph(sf.sf, &nroots, &nleaves, &local, &remote))
+
+    if local == NULL:
+        ilocal = None
+    else:
+        ilocal = _readonly(_int_view(<PetscInt *> local, nleaves))
+
+    # PetscSFNode is a pair of PetscInts so view the nodes as a 2D array
+    if nleaves == 0:
+        empty = <PetscInt[:1, :2]> <PetscInt *> _malloc(2 * sizeof(PetscInt))
+        empty.callback_free_data = free
+        iremote = empty[:0]
+    else:
+        iremote = <PetscInt[:nleaves, :2]> <PetscInt *> remote
+    return (
+        nroots, ilocal, _readonly(iremote[:, 0]), _readonly(iremote[:, 1])
+    )
+
+
+# Mat
+cdef inline void mat_set_preallocation_coo(
+    cpetsc.Mat_py mat, const PetscInt[:] rows, const PetscInt[:] cols
+):
+    """Preallocate a matrix for the COO entries with the given global row
+    and column indices.
+
+    The indices are copied since PETSc is free to modify them. Values should
+    subsequently be set with ``mat_set_values_coo``.
+    """
+    cdef PetscCount i, n = rows.shape[0]
+    cdef PetscInt *coo_i = NULL
+    cdef PetscInt *coo_j = NULL
+
+    if cols.shape[0] != n:
+        raise ValueError("rows and cols must have the same length")
+
+    CHKERR(cpetsc.PetscMalloc1(n, &coo_i))
+    CHKERR(cpetsc.PetscMalloc1(n, &coo_j))
+    try:
+        for i in range(n):
+            coo_i[i] = rows[i]
+            coo_j[i] = cols[i]
+        CHKERR(cpetsc.MatSetPreallocationCOO(mat.mat, n, coo_i, coo_j))
+    finally:
+        CHKERR(cpetsc.PetscFree(coo_i))
+        CHKERR(cpetsc.PetscFree(coo_j))
+
+
+cdef inline void mat_set_values_coo(
+    cpetsc.Mat_py mat, const PetscScalar[::1] values, InsertMode mode
+):
+    """Set the values of the COO entries given to
+    ``mat_set_preallocation_coo`` and assemble the matrix.
+    """
+    cdef const PetscScalar *data = NULL
+
+    if values.shape[0] > 0:
+        data = &values[0]
+    CHKERR(cpetsc.MatSetValuesCOO(mat.mat, data, mode))
+
+
+cdef inline void mat_set_values_triplets(
+    cpetsc.Mat_py mat,
+    const PetscInt[::1] rows,
+    const PetscInt[::1] cols,
+    const PetscScalar[::1] values,
+    InsertMode mode,
+):
+    """Insert (row, column, value) triplets into a matrix.
+
+    Consecutive triplets with the same row are inserted together so sorting
+    the triplets by row reduces the number of calls into PETSc. This does
+    not assemble the matrix and is useful for matrix types that do not
+    support COO assembly.
+    """
+    cdef PetscInt start = 0, end, n = rows.shape[0]
+
+    if cols.shape[0] != n or values.shape[0] != n:
+        raise ValueError("rows, cols and values must have the same length")
+
+    while start < n:
+        end = start + 1
+        while end < n and rows[end] == rows[start]:
+            end += 1
+        CHKERR(
+            cpetsc.MatSetValues(
+                mat.mat, 1, &rows[start], end - start, &cols[start],
+                &values[start], mode,
+            )
+        )
+        start = end
@@ -1,5 +1,9 @@
+from __future__ import annotations
+
+import functools
 import os
 import sys
+import time
 import types
 import warnings
 from collections.abc import Sequence
@@ -14,13 +18,19 @@ import petsctools.options
 from petsctools.exceptions import (
     InvalidEnvironmentException,
     InvalidPetscVersionException,
+    PetscToolsException,
 )
+from petsctools.log import reduce_timings
+
+_init_timings = None
+"""The time spent in each phase of `init`, if profiling was requested."""
 
 
 def init(
     argv: Sequence[str] | None = None,
     *,
     version_spec: SpecifierSet | str = "",
+    profile: bool = False,
 ) -> types.ModuleType:
     """Initialise PETSc.
 
@@ -32,6 +42,9 @@ def init(
     version_spec
         String describing PETSc version constraints. For example
         '>=3.25.2,<3.26'.
+    profile
+        If `True` then record the time spent in each phase of initialisation.
+        The timings may be retrieved with `get_init_profile`.
 
     Returns
     -------
@@ -40,6 +53,18 @@ def init(
         boilerplate.
 
     """
+    global _init_timings
+
+    timings = {}
+    tic = time.perf_counter()
+
+    def record(phase):
+        nonlocal tic
+        if profile:
+            toc = time.perf_counter()
+            timings[phase] = toc - tic
+            tic = toc
+
     if argv is None:
         argv = sys.argv
 
@@ -55,25 +80,73 @@ def init(
         )
     else:
         PETSc._initialize(argv)
+    record("initialize")
 
     check_environment_matches_petsc4py_config()
+    record("check_environment")
     check_petsc_version(version_spec)
+    record("check_version")
 
     # Save the command line options so they may be inspected later
-    petsctools.options._commandline_options = frozenset(
-        PETSc.Options().getAll()
+    petsctools.options._commandline_options = (
+        petsctools.options.CommandlineOptions(PETSc.Options().getAll())
     )
+    record("commandline_options")
+
+    if profile:
+        _init_timings = timings
 
     return PETSc
 
 
+def get_init_profile(
+    comm: petsc4py.PETSc.Comm | None = None,
+) -> dict[str, dict[str, float]]:
+    """Return the time spent in each phase of `init`.
+
+    Parameters
+    ----------
+    comm
+        If provided, the timings are reduced across the ranks of this
+        communicator. Otherwise only the timings for this rank are returned.
+
+    Returns
+    -------
+        Mapping from each phase (in the order in which they were run) to a
+        dictionary with the keys ``"min"``, ``"max"`` and ``"mean"``.
+
+    Raises
+    ------
+    PetscToolsException
+        If `init` has not been called with ``profile=True``.
+
+    Notes
+    -----
+    If ``comm`` is provided then this function is collective over it.
+
+    """
+    if _init_timings is None:
+        raise PetscToolsException(
+            "No timings available, call 'petsctools.init' with 'profile=True'"
+        )
+    return reduce_timings(_init_timings, comm)
+
+
 def check_environment_matches_petsc4py_config():
+    # The result only depends on the environment so it is cached
+    _check_environment_matches_petsc4py_config(
+        os.environ.get("PETSC_DIR"), os.environ.get("PETSC_ARCH")
+    )
+
+
+@functools.lru_cache
+def _check_environment_matches_petsc4py_config(env_petsc_dir, env_petsc_arch):
     config = petsc4py.get_config()
     petsc_dir = config["PETSC_DIR"]
     petsc_arch = config["PETSC_ARCH"]
     if (
-        Path(os.environ.get("PETSC_DIR", petsc_dir)) != Path(petsc_dir)
-        or os.environ.get("PETSC_ARCH", petsc_arch) != petsc_arch
+        (env_petsc_dir is not None and Path(env_petsc_dir) != Path(petsc_dir))
+        or (env_petsc_arch is not None and env_petsc_arch != petsc_arch)
     ):
         raise InvalidEnvironmentException(
             "PETSC_DIR and/or PETSC_ARCH are set but do not match the "
@@ -83,6 +156,13 @@ def check_environment_matches_petsc4py_config():
 
 
 def check_petsc_version(version_spec) -> None:
+    # The installed versions cannot change so the result only depends
+    # on the constraints and is cached
+    _check_petsc_version(str(version_spec))
+
+
+@functools.lru_cache
+def _check_petsc_version(version_spec: str) -> None:
     import petsc4py.PETSc
 
     version_spec = SpecifierSet(version_spec)
@@ -0,0 +1,138 @@
+"""Helpers for profiling code that uses petsctools."""
+
+from __future__ import annotations
+
+import functools
+from collections.abc import Callable
+
+import petsc4py
+
+_log_events = {}
+"""PETSc log events created by petsctools, indexed by name."""
+
+
+def get_log_event(name: str) -> petsc4py.PETSc.Log.Event:
+    """Return the PETSc log event with a given name.
+
+    The event is created the first time that it is requested.
+
+    Parameters
+    ----------
+    name
+        The name of the event.
+
+    Returns
+    -------
+        The log event.
+    """
+    try:
+        return _log_events[name]
+    except KeyError:
+        from petsc4py import PETSc
+
+        event = _log_events[name] = PETSc.Log.Event(name)
+        return event
+
+
+_log_stages = {}
+"""PETSc log stages created by petsctools, indexed by name."""
+
+
+def get_log_stage(name: str) -> petsc4py.PETSc.Log.Stage:
+    """Return the PETSc log stage with a given name.
+
+    The stage is created the first time that it is requested.
+
+    Parameters
+    ----------
+    name
+        The name of the stage.
+
+    Returns
+    -------
+        The log stage.
+    """
+    try:
+        return _log_stages[name]
+    except KeyError:
+        from petsc4py import PETSc
+
+        stage = _log_stages[name] = PETSc.Log.Stage(name)
+        return stage
+
+
+def wrap_log_event(func: Callable, name: str) -> Callable:
+    """Wrap a function so that each call is timed by a PETSc log event.
+
+    Parameters
+    ----------
+    func
+        The function to wrap.
+    name
+        The name of the log event.
+
+    Returns
+    -------
+        The wrapped function.
+    """
+    event = get_log_event(name)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        event.begin()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            event.end()
+
+    return wrapper
+
+
+def reduce_timings(
+    timings: dict[str, float],
+    comm: petsc4py.PETSc.Comm | None = None,
+) -> dict[str, dict[str, float]]:
+    """Reduce a set of timings across the ranks of a communicator.
+
+    Parameters
+    ----------
+    timings
+        Mapping from a label to the time (in seconds) spent on this rank.
+        Every rank must pass the same labels in the same order.
+    comm
+        The communicator to reduce over. If not provided then the timings
+        are not reduced and the statistics only describe this rank.
+
+    Returns
+    -------
+        Mapping from each label to a dictionary with the keys ``"min"``,
+        ``"max"`` and ``"mean"``.
+
+    Notes
+    -----
+    This function is collective over ``comm``.
+    """
+    if comm is None or comm.getSize() == 1:
+        return {
+            label: {"min": time, "max": time, "mean": time}
+            for label, time in timings.items()
+        }
+
+    from petsc4py import PETSc
+
+    # petsc4py does not expose MPI reductions directly so use a vector
+    # with a single entry per rank instead.
+    vec = PETSc.Vec().createMPI((1, PETSc.DECIDE), comm=comm)
+    try:
+        size = comm.getSize()
+        stats = {}
+        for label, time in timings.items():
+            vec.set(time)
+            stats[label] = {
+                "min": vec.min()[1],
+                "max": vec.max()[1],
+                "mean": vec.sum() / size,
+            }
+        return stats
+    finally:
+        vec.destroy()
@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import abc
+
+import numpy as np
+import petsc4py
+
+from petsctools.log import wrap_log_event
+from petsctools.utils import _WorkVecPool
+
+
+class MatBase(abc.ABC):
+    """Abstract base class for python type PETSc Mats.
+
+    This is a convenience base class for matrix-free operators, mirroring
+    :class:`petsctools.PCBase` for preconditioners. It provides:
+
+    1. Derived operations.
+
+       Only ``mult`` must be implemented. ``multAdd`` and
+       ``multTransposeAdd`` are implemented in terms of ``mult`` and
+       ``multTranspose``, and ``matMult`` applies the operator to each
+       column of a dense matrix. PETSc uses ``matMult`` for products of
+       this matrix with a dense matrix (e.g. ``mat.matMult(X)``).
+
+    2. Cached diagonals.
+
+       ``getDiagonal`` calls the user implemented ``compute_diagonal``
+       method. If the ``cache_diagonal`` attribute is set then the diagonal
+       is only recomputed if the state of the matrix has changed (e.g. by
+       calling ``mat.assemble()``).
+
+    3. Profiling the operator.
+
+       If the ``log_events`` attribute is set, or the option
+       ``-{prefix}log_events`` is passed (where ``prefix`` is the options
+       prefix of the matrix), then PETSc log events are registered for each
+       operation in ``logged_methods``. These are named after the class
+       and prefix so that ``-log_view`` reports the time spent in each
+       operator separately.
+
+    4. Providing temporary vectors.
+
+       The ``get_work_vec`` method returns a vector with the same layout
+       as a template vector. These vectors are created once and reused
+       between calls.
+
+    Inheriting classes should implement the following methods:
+
+    * ``mult``
+
+    and may optionally implement:
+
+    * ``multTranspose``
+    * ``compute_diagonal``
+
+    They may also set the following class attributes:
+
+    * ``cache_diagonal`` (optional, defaults to False).
+    * ``log_events`` (optional, defaults to False).
+
+    Notes
+    -----
+    The methods are prepared when PETSc calls ``create``, which happens
+    when the context is attached to the matrix (e.g. by
+    ``PETSc.Mat().createPython(sizes, context=ctx)``). Since the options
+    prefix can only be set after this, the ``-{prefix}log_events`` option
+    is checked when one of the ``logged_methods`` is first called.
+    Inheriting classes that override ``create`` or ``destroy`` must call
+    the base class method.
+    """
+
+    cache_diagonal = False
+    """Set this to True to only recompute the diagonal if the Mat changes."""
+
+    log_events = False
+    """Set this to True to time each operation with PETSc log events."""
+
+    logged_methods = (
+        "mult", "multTranspose", "multAdd", "multTransposeAdd",
+        "getDiagonal", "matMult",
+    )
+    """The methods that are timed if log events are enabled."""
+
+    def __init__(self):
+        self._work_vecs = _WorkVecPool()
+        self._diagonal = None
+        self._diagonal_state = None
+
+    def create(self, mat):
+        """Called by PETSc when this context is attached to a Mat."""
+        # The options prefix of the Mat can only be set after this so the
+        # methods are set up when one of them is first called.
+        methods = {
+            method: self._work_vecs.release_after(getattr(self, method))
+            for method in self.logged_methods
+        }
+        for method in self.logged_methods:
+            setattr(self, method, self._set_up_on_first_call(methods, method))
+
+    def _set_up_on_first_call(self, methods, method):
+        def first_call(mat, *args):
+            self._set_up_methods(mat, methods)
+            return getattr(self, method)(mat, *args)
+        return first_call
+
+    def _set_up_methods(self, mat, methods):
+        """Install the methods, wrapping them in PETSc log events if
+        requested.
+        """
+        from petsc4py import PETSc
+
+        prefix = mat.getOptionsPrefix() or ""
+        log_events = (
+            self.log_events
+            or PETSc.Options().getBool(prefix + "log_events", False)
+        )
+        name = f"{type(self).__name__}({prefix})"
+        for method, func in methods.items():
+            if log_events:
+                func = wrap_log_event(func, f"{name}.{method}")
+            setattr(self, method, func)
+
+    def destroy(self, mat):
+        """Called by PETSc when the Mat is destroyed."""
+        self._work_vecs.destroy()
+        if self._diagonal is not None:
+            self._diagonal.destroy()
+            self._diagonal = None
+
+    def get_work_vec(self, template):
+        """Return a work vector with the same layout as template.
+
+        Work vectors are created the first time they are requested and are
+        then reused. Repeated requests within a single operation return
+        distinct vectors, which are returned to the pool at the end of the
+        operation. The contents of the vector are undefined.
+
+        Parameters
+        ----------
+        template
+            The PETSc Vec whose layout should be matched.
+
+        Returns
+        -------
+            A PETSc Vec with the same type and sizes as ``template``.
+        """
+        return self._work_vecs.get(template)
+
+    @abc.abstractmethod
+    def mult(self, mat, x, y):
+        """Apply the operator to x, putting the result in y.
+
+        Both x and y are PETSc Vecs, y is not guaranteed to be zero on entry.
+        """
+
+    def multTranspose(self, mat, x, y):
+        """Apply the operator transpose to x, putting the result in y.
+
+        Both x and y are PETSc Vecs, y is not guaranteed to be zero on entry.
+        """
+        raise NotImplementedError(
+            "Need to implement the transpose action of this Mat")
+
+    def multAdd(self, mat, x, y, z):
+        """Apply the operator to x and add y, putting the result in z.
+
+        z may be the same vector as y.
+        """
+        w = self.get_work_vec(z)
+        self.mult(mat, x, w)
+        if z.handle != y.handle:
+            y.copy(z)
+        z.axpy(1.0, w)
+
+    def multTransposeAdd(self, mat, x, y, z):
+        """Apply the operator transpose to x and add y, putting the result
+        in z.
+
+        z may be the same vector as y.
+        """
+        w = self.get_work_vec(z)
+        self.multTranspose(mat, x, w)
+        if z.handle != y.handle:
+            y.copy(z)
+        z.axpy(1.0, w)
+
+    def matMult(self, mat, X, Y):
+        """Apply the operator to the columns of X, putting the result in the
+        columns of Y.
+
+        Both X and Y are dense PETSc Mats. The default implementation calls
+        ``mult`` for each column in turn. Operators that can act on many
+        vectors at once should override this method.
+        """
+        for i in range(X.getSize()[1]):
+            x = X.getDenseColumnVec(i, "r")
+            y = Y.getDenseColumnVec(i, "w")
+            try:
+                self.mult(mat, x, y)
+            finally:
+                X.restoreDenseColumnVec(i, "r")
+                Y.restoreDenseColumnVec(i, "w")
+
+    def productSetFromOptions(self, mat, producttype, A, B, C):
+        """Called by PETSc to check whether a matrix product is supported.
+
+        Only the product ``A * B`` where ``A`` is this matrix and ``B`` is
+        dense is supported, which is computed with ``matMult``.
+        """
+        from petsc4py import PETSc
+
+        return (
+            producttype == "AB"
+            and mat is A
+            and B.getType() in {PETSc.Mat.Type.SEQDENSE,
+                                PETSc.Mat.Type.MPIDENSE}
+        )
+
+    def productSymbolic(self, mat, product, producttype, A, B, C):
+        """Called by PETSc to create the dense result of ``A * B``."""
+        product.setType(B.getType())
+        product.setSizes((A.getSizes()[0], B.getSizes()[1]))
+        product.setUp()
+        product.assemble()
+
+    def productNumeric(self, mat, product, producttype, A, B, C):
+        """Called by PETSc to compute ``A * B`` with ``matMult``."""
+        self.matMult(mat, B, product)
+
+    def getDiagonal(self, mat, d):
+        """Put the diagonal of the operator into d.
+
+        This calls ``compute_diagonal``, caching the result if
+        ``cache_diagonal`` is set.
+        """
+        if not self.cache_diagonal:
+            self.compute_diagonal(mat, d)
+            return
+
+        state = mat.stateGet()
+        if self._diagonal is None or self._diagonal_state != state:
+            if self._diagonal is None:
+                self._diagonal = d.duplicate()
+            self.compute_diagonal(mat, self._diagonal)
+            self._diagonal_state = state
+        self._diagonal.copy(d)
+
+    def compute_diagonal(self, mat, d):
+        """Compute the diagonal of the operator, putting the result in d."""
+        raise NotImplementedError(
+            "Need to implement the diagonal of this Mat")
+
+
+def get_coo_preallocation(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    row_range: tuple[int, int],
+    col_range: tuple[int, int],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the AIJ preallocation for a set of COO entries.
+
+    Parameters
+    ----------
+    rows
+        The global row index of each entry.
+    cols
+        The global column index of each entry.
+    row_range
+        The range of rows owned by this rank, as returned by
+        ``mat.getOwnershipRange()``.
+    col_range
+        The range of columns in the diagonal block of this rank, as returned
+        by ``mat.getOwnershipRangeColumn()``.
+
+    Returns
+    -------
+        The number of nonzeros in each owned row of the diagonal and
+        off-diagonal blocks (``d_nnz`` and ``o_nnz``). Duplicate entries are
+        only counted once.
+
+    Notes
+    -----
+    Only entries in rows owned by this rank are counted. Entries with a
+    negative column index are ignored by PETSc and so are not counted
+    either.
+    """
+    from petsc4py import PETSc
+
+    rows = np.asarray(rows)
+    cols = np.asarray(cols)
+    rstart, rend = row_range
+    cstart, cend = col_range
+
+    owned = (rows >= rstart) & (rows < rend) & (cols >= 0)
+    rows = rows[owned]
+    cols = cols[owned]
+
+    # Remove duplicate entries
+    order = np.lexsort((cols, rows))
+    rows = rows[order]
+    cols = cols[order]
+    unique = np.ones(len(rows), dtype=bool)
+    unique[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+    rows = rows[unique]
+    cols = cols[unique]
+
+    diag = (cols >= cstart) & (cols < cend)
+    nrows = rend - rstart
+    d_nnz = np.bincount(rows[diag] - rstart, minlength=nrows)
+    o_nnz = np.bincount(rows[~diag] - rstart, minlength=nrows)
+    return d_nnz.astype(PETSc.IntType), o_nnz.astype(PETSc.IntType)
+
+
+def set_values_coo(
+    mat: petsc4py.PETSc.Mat,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    values: np.ndarray,
+    addv: petsc4py.PETSc.InsertMode | None = None,
+) -> None:
+    """Preallocate and assemble a matrix from COO entries.
+
+    Duplicate entries are summed. Each process may pass entries in any
+    row, which are communicated to the owning process by PETSc.
+
+    Parameters
+    ----------
+    mat
+        The matrix, which must have its sizes and type set.
+    rows
+        The global row index of each entry.
+    cols
+        The global column index of each entry.
+    values
+        The value of each entry.
+    addv
+        Whether to insert (the default) or add the values to the matrix.
+    """
+    from petsc4py import PETSc
+
+    if addv is None:
+        addv = PETSc.InsertMode.INSERT_VALUES
+
+    # PETSc may modify the indices so pass copies
+    mat.setPreallocationCOO(
+        np.array(rows, dtype=PETSc.IntType),
+        np.array(cols, dtype=PETSc.IntType),
+    )
+    mat.setValuesCOO(values, addv)
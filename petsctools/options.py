@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import atexit
+import bisect
+import collections
 import contextlib
 import functools
+import heapq
 import itertools
+import time
 import warnings
 import weakref
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from collections.abc import Set as AbstractSet
 from functools import cached_property
 from typing import Any
 
@@ -17,11 +23,87 @@ from petsctools.exceptions import (
     PetscToolsNotInitialisedException,
     PetscToolsWarning,
 )
+from petsctools.log import get_log_stage
 
 _commandline_options = None
 
 
-def get_commandline_options() -> frozenset:
+class CommandlineOptions(AbstractSet):
+    """The names of the PETSc options passed on the command line.
+
+    This is a compact, read-only set of option names. Only the sorted names
+    are stored; values are looked up in the global ``PETSc.Options``
+    database on demand.
+
+    Parameters
+    ----------
+    options
+        The names of the options.
+
+    See Also
+    --------
+    get_commandline_options
+    """
+
+    def __init__(self, options: Iterable[str]):
+        self._names = tuple(sorted(options))
+
+    def __contains__(self, option: object) -> bool:
+        i = bisect.bisect_left(self._names, option)
+        return i < len(self._names) and self._names[i] == option
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __getitem__(self, option: str) -> str:
+        """Return the current value of a command line option.
+
+        Parameters
+        ----------
+        option
+            The name of the option.
+
+        Returns
+        -------
+            The value of the option in the global ``PETSc.Options``
+            database, as a string.
+
+        Raises
+        ------
+        KeyError
+            If the option was not passed on the command line.
+        """
+        from petsc4py import PETSc
+
+        if option not in self:
+            raise KeyError(option)
+        return PETSc.Options().getString(option)
+
+    def with_prefix(self, prefix: str) -> tuple[str, ...]:
+        """Return the names of the options starting with a prefix.
+
+        Parameters
+        ----------
+        prefix
+            The prefix to search for.
+
+        Returns
+        -------
+            The sorted names of all options starting with ``prefix``.
+        """
+        start = bisect.bisect_left(self._names, prefix)
+        stop = start
+        while (
+            stop < len(self._names) and self._names[stop].startswith(prefix)
+        ):
+            stop += 1
+        return self._names[start:stop]
+
+
+def get_commandline_options() -> CommandlineOptions:
     """Return the PETSc options passed on the command line."""
     if _commandline_options is None:
         raise PetscToolsNotInitialisedException(
@@ -122,6 +204,13 @@ def _warn_unused_options(all_options: Iterable, used_options: Iterable,
     """
     unused_options = set(all_options) - set(used_options)
 
+    # Defer to the collective report if one has been requested
+    if _unused_options_report is not None:
+        _unused_options_report.update(
+            options_prefix + option for option in unused_options
+        )
+        return
+
     for option in sorted(unused_options):
         warnings.warn(
             f"Unused PETSc option: {options_prefix+option}",
@@ -129,6 +218,351 @@ def _warn_unused_options(all_options: Iterable, used_options: Iterable,
         )
 
 
+_unused_options_report = None
+"""Unused options collected for a collective report, if one is requested."""
+
+_unused_options_managers = weakref.WeakSet()
+"""Live OptionsManagers which are checking for unused options."""
+
+
+def report_unused_options(
+    reduction: str = "union",
+    comm: petsc4py.PETSc.Comm | None = None,
+) -> None:
+    """Print a single summary of the unused PETSc options on all ranks.
+
+    Unused options are collected from every :class:`OptionsManager` created
+    with ``-options_left`` set, both those that have already been destroyed
+    (if :func:`report_unused_options_at_exit` has been called) and those
+    that are still alive. The summary is printed on rank 0.
+
+    Parameters
+    ----------
+    reduction
+        Either ``"union"``, to report options unused on any rank, or
+        ``"intersection"``, to report options unused on every rank.
+    comm
+        The communicator to reduce over. Defaults to ``PETSc.COMM_WORLD``.
+        Reducing over more than one rank requires mpi4py.
+
+    Notes
+    -----
+    This function is collective over ``comm``.
+
+    See Also
+    --------
+    report_unused_options_at_exit
+    """
+    from petsc4py import PETSc
+
+    if reduction not in {"union", "intersection"}:
+        raise ValueError(
+            f"reduction must be 'union' or 'intersection', not '{reduction}'"
+        )
+    if comm is None:
+        comm = PETSc.COMM_WORLD
+
+    unused_options = set(_unused_options_report or ())
+    for manager in _unused_options_managers:
+        unused_options.update(
+            manager.options_prefix + option
+            for option in set(manager.to_delete) - manager._used_options
+        )
+
+    if comm.getSize() > 1:
+        gathered = comm.tompi4py().gather(unused_options, root=0)
+        if comm.getRank() == 0:
+            if reduction == "union":
+                unused_options = set.union(*gathered)
+            else:
+                unused_options = set.intersection(*gathered)
+
+    if unused_options:
+        PETSc.Sys.Print(
+            "Unused PETSc options:\n"
+            + "".join(f"  {option}\n" for option in sorted(unused_options)),
+            comm=comm,
+        )
+
+
+def report_unused_options_at_exit(
+    reduction: str = "union",
+    comm: petsc4py.PETSc.Comm | None = None,
+) -> None:
+    """Print a single summary of the unused PETSc options at exit.
+
+    Instead of each :class:`OptionsManager` warning about its own unused
+    options when it is destroyed, the unused options are collected and
+    :func:`report_unused_options` is called at the end of the program.
+
+    Parameters
+    ----------
+    reduction
+        Either ``"union"``, to report options unused on any rank, or
+        ``"intersection"``, to report options unused on every rank.
+    comm
+        The communicator to reduce over. Defaults to ``PETSc.COMM_WORLD``.
+
+    Notes
+    -----
+    This function must be called on every rank of ``comm``.
+
+    See Also
+    --------
+    report_unused_options
+    """
+    global _unused_options_report
+
+    if _unused_options_report is None:
+        _unused_options_report = set()
+    atexit.register(report_unused_options, reduction, comm)
+
+
+_recycled_prefixes = None
+"""Free prefix numbers for each default prefix, or None if not recycling."""
+
+
+def recycle_default_prefixes(enable: bool = True) -> None:
+    """Reuse the automatically generated prefixes of collected managers.
+
+    By default every :class:`OptionsManager` created without an
+    ``options_prefix`` receives a new prefix ``"{default_prefix}{n}_"``, so
+    long running applications that create many transient solvers keep
+    adding new option names to the PETSc options database. When recycling
+    is enabled the number ``n`` of a garbage collected manager is returned
+    to a pool and the lowest free number is handed to the next manager
+    with the same ``default_prefix``. The number of distinct generated
+    prefixes is then bounded by the number of managers alive at once.
+
+    Parameters
+    ----------
+    enable
+        Whether to recycle prefixes for managers created from now on.
+
+    Notes
+    -----
+    A prefix is only released when its manager is garbage collected, so
+    any PETSc object using the prefix should keep the manager alive, for
+    example by using :func:`attach_options`.
+
+    See Also
+    --------
+    OptionsManager
+    """
+    global _recycled_prefixes
+
+    if not enable:
+        _recycled_prefixes = None
+    elif _recycled_prefixes is None:
+        _recycled_prefixes = collections.defaultdict(list)
+
+
+class OptionsMonitor:
+    """Statistics about the options inserted by :class:`OptionsManager`.
+
+    The monitor is updated by :meth:`OptionsManager.inserted_options` each
+    time options are inserted into, or deleted from, the global PETSc
+    options database. Only the options handled by petsctools are counted.
+
+    Parameters
+    ----------
+    sample_every
+        If provided, record the total size of the options database every
+        ``sample_every`` insertions. This is more expensive than the other
+        statistics because it queries the whole database.
+
+    Attributes
+    ----------
+    insertions
+        Number of options inserted, for each options prefix.
+    deletions
+        Number of options deleted, for each options prefix.
+    used_queries
+        Number of queries of whether an option was used, for each options
+        prefix.
+    high_water_mark
+        The largest number of options inserted by petsctools that were in
+        the database at once.
+    samples
+        List of ``(time, size)`` pairs recording the size of the options
+        database, if ``sample_every`` was provided.
+
+    See Also
+    --------
+    monitor_options
+    get_options_monitor
+    """
+
+    def __init__(self, sample_every: int | None = None):
+        self.sample_every = sample_every
+        self.insertions = collections.Counter()
+        self.deletions = collections.Counter()
+        self.used_queries = collections.Counter()
+        self.high_water_mark = 0
+        self.samples = []
+        self._live_options = set()
+        self._leak_suspects = set()
+        self._ninserted = 0
+
+    @property
+    def live_options(self) -> frozenset[str]:
+        """The options inserted by petsctools that are in the database."""
+        return frozenset(self._live_options)
+
+    @property
+    def leak_suspects(self) -> frozenset[str]:
+        """Options inserted by petsctools that were never deleted.
+
+        These are options that are still in the database after the
+        :meth:`OptionsManager.inserted_options` context that inserted them
+        has exited. They are usually options that were already in the
+        database when the :class:`OptionsManager` was created, for example
+        from the command line, and may be expected.
+        """
+        return frozenset(self._leak_suspects)
+
+    def _record_insert(self, prefix: str, options: Iterable[str]):
+        options = [prefix + option for option in options]
+        self.insertions[prefix] += len(options)
+        self._live_options.update(options)
+        self.high_water_mark = max(
+            self.high_water_mark, len(self._live_options)
+        )
+        self._ninserted += 1
+        if self.sample_every and self._ninserted % self.sample_every == 0:
+            self.samples.append(
+                (time.perf_counter(), len(_get_options_object().getAll()))
+            )
+
+    def _record_delete(self, prefix: str, inserted: Iterable[str],
+                       deleted: Iterable[str], used_queries: int):
+        deleted = {prefix + option for option in deleted}
+        self.deletions[prefix] += len(deleted)
+        self.used_queries[prefix] += used_queries
+        self._live_options.difference_update(deleted)
+        self._leak_suspects.difference_update(deleted)
+        self._leak_suspects.update(
+            option for option in (prefix + option for option in inserted)
+            if option not in deleted
+        )
+
+    def report(self, comm: petsc4py.PETSc.Comm | None = None) -> None:
+        """Print a summary of the statistics.
+
+        Parameters
+        ----------
+        comm
+            The communicator to print on. The statistics of rank 0 of
+            ``comm`` are printed. Defaults to ``PETSc.COMM_WORLD``.
+        """
+        from petsc4py import PETSc
+
+        if comm is None:
+            comm = PETSc.COMM_WORLD
+
+        lines = [
+            "PETSc options inserted by petsctools:",
+            f"  High water mark: {self.high_water_mark}",
+            f"  Currently inserted: {len(self._live_options)}",
+        ]
+        if self.samples:
+            size = max(size for _, size in self.samples)
+            lines.append(f"  Largest sampled database size: {size}")
+        lines.append(
+            f"  {'Prefix':<30} {'Inserted':>10} {'Deleted':>10}"
+            f" {'Used queries':>13}"
+        )
+        for prefix in sorted(self.insertions):
+            lines.append(
+                f"  {prefix:<30} {self.insertions[prefix]:>10}"
+                f" {self.deletions[prefix]:>10}"
+                f" {self.used_queries[prefix]:>13}"
+            )
+        if self._leak_suspects:
+            lines.append("  Options never deleted:")
+            lines.extend(
+                f"    {option}" for option in sorted(self._leak_suspects)
+            )
+        PETSc.Sys.Print("\n".join(lines), comm=comm)
+
+
+_options_monitor = None
+"""The active OptionsMonitor, if any."""
+
+
+def monitor_options(
+    enable: bool = True,
+    *,
+    sample_every: int | None = None,
+    report_at_exit: bool = False,
+) -> OptionsMonitor | None:
+    """Start or stop monitoring the options inserted by petsctools.
+
+    Parameters
+    ----------
+    enable
+        Whether to monitor the options database.
+    sample_every
+        If provided, record the size of the options database every
+        ``sample_every`` insertions. See :class:`OptionsMonitor`.
+    report_at_exit
+        Whether to print :meth:`OptionsMonitor.report` at exit.
+
+    Returns
+    -------
+        The new monitor, or ``None`` if monitoring is disabled.
+
+    See Also
+    --------
+    OptionsMonitor
+    get_options_monitor
+    """
+    global _options_monitor
+
+    if not enable:
+        _options_monitor = None
+        return None
+
+    _options_monitor = OptionsMonitor(sample_every=sample_every)
+    if report_at_exit:
+        atexit.register(_options_monitor.report)
+    return _options_monitor
+
+
+def get_options_monitor() -> OptionsMonitor | None:
+    """Return the active :class:`OptionsMonitor`, if there is one."""
+    return _options_monitor
+
+
+_use_log_stages = False
+"""Whether inserted_options pushes a log stage for each options prefix."""
+
+
+def use_log_stages(enable: bool = True) -> None:
+    """Profile each options prefix in its own PETSc log stage.
+
+    When enabled, :meth:`OptionsManager.inserted_options` pushes a
+    ``PETSc.Log.Stage`` named after the options prefix on entry and pops
+    it on exit. This gives a separate breakdown in ``-log_view`` for every
+    solver without any changes to the application. Managers with an empty
+    prefix are not given a stage.
+
+    Parameters
+    ----------
+    enable
+        Whether to push log stages.
+
+    Notes
+    -----
+    A new stage is created for every distinct prefix. If many managers are
+    created without an ``options_prefix`` then consider using
+    :func:`recycle_default_prefixes` to bound the number of stages.
+    """
+    global _use_log_stages
+
+    _use_log_stages = enable
+
+
 def _validate_prefix(prefix):
     """Valid prefixes are strings ending with an underscore.
     """
@@ -383,7 +817,9 @@ class OptionsManager:
         is not provided then a prefix is automatically generated with the
         form "{default_prefix}_{n}", where n is a unique integer. Note that
         because the unique integer is not stable any options passed via the
-        command line with a matching prefix will be ignored.
+        command line with a matching prefix will be ignored. The integers
+        of collected managers may be reused, see
+        :func:`recycle_default_prefixes`.
     default_options_set
         The prefix set for any default shared with other solvers.
         See :class:`DefaultOptionSet` for more information.
@@ -403,6 +839,17 @@ class OptionsManager:
     AppContextManager
     """
 
+    # Applications may create very many managers so keep them compact
+    __slots__ = (
+        "__weakref__",
+        "_setfromoptions",
+        "_used_options",
+        "appmngr",
+        "options_prefix",
+        "parameters",
+        "to_delete",
+    )
+
     count = itertools.count()
 
     def __init__(self, parameters: dict,
@@ -422,7 +869,13 @@ class OptionsManager:
         if options_prefix is None:
             default_prefix = default_prefix or "petsctools_"
             default_prefix = _validate_prefix(default_prefix)
-            self.options_prefix = f"{default_prefix}{next(self.count)}_"
+            if _recycled_prefixes is None:
+                number = next(self.count)
+            else:
+                free = _recycled_prefixes[default_prefix]
+                number = heapq.heappop(free) if free else next(self.count)
+                weakref.finalize(self, heapq.heappush, free, number)
+            self.options_prefix = f"{default_prefix}{number}_"
             self.parameters = parameters
             self.to_delete = set(parameters)
 
@@ -447,12 +900,16 @@ class OptionsManager:
             # options when combining the parameters from the
             # defaults and the source code.
 
+            commandline_options = set(
+                get_commandline_options().with_prefix(options_prefix)
+            )
+
             # Start building parameters from the defaults so
             # that they will overwritten by any other source.
             self.parameters = {
                 k: v
                 for k, v in default_options.items()
-                if options_prefix + k not in get_commandline_options()
+                if options_prefix + k not in commandline_options
             }
 
             # Update using the parameters passed in the code but
@@ -462,7 +919,7 @@ class OptionsManager:
             self.parameters.update({
                 k: v
                 for k, v in parameters.items()
-                if options_prefix + k not in get_commandline_options()
+                if options_prefix + k not in commandline_options
             })
             self.to_delete = set(self.parameters)
 
@@ -480,14 +937,25 @@ class OptionsManager:
         self.appmngr = appmngr
 
         # Keep track of options used between invocations of inserted_options().
+        # This is only needed to warn about unused options.
         self._used_options = set()
 
-        # Decide whether to warn for unused options
-        with self.inserted_options():
-            if self.options_object.getBool("options_left", False):
-                weakref.finalize(self, _warn_unused_options,
-                                 self.to_delete, self._used_options,
-                                 options_prefix=self.options_prefix)
+        # Decide whether to warn for unused options. This only requires
+        # inserting the parameters if they could set -options_left.
+        if self.options_prefix or "options_left" not in self.parameters:
+            options_left = self.options_object.getBool("options_left", False)
+        else:
+            with self.inserted_options():
+                options_left = self.options_object.getBool(
+                    "options_left", False
+                )
+        if options_left:
+            _unused_options_managers.add(self)
+            weakref.finalize(self, _warn_unused_options,
+                             self.to_delete, self._used_options,
+                             options_prefix=self.options_prefix)
+        else:
+            self._used_options = None
 
     def set_default_parameter(self, key: str, val: Any) -> None:
         """Set a default parameter value.
@@ -547,26 +1015,54 @@ class OptionsManager:
         contains the parameters from this object.
         If this OptionsManager has an ``appmngr`` then all entries
         are inserted into the :class:`AppContext`.
+
+        If :func:`use_log_stages` has been called then the block is
+        profiled in a PETSc log stage named after the options prefix.
         """
+        monitor = _options_monitor
+        stage = None
+        if _use_log_stages and self.options_prefix:
+            stage = get_log_stage(self.options_prefix)
+            stage.push()
         try:
             for k, v in self.parameters.items():
                 self.options_object[self.options_prefix + k] = v
+            if monitor is not None:
+                monitor._record_insert(self.options_prefix, self.parameters)
             if self.appmngr:
                 with self.appmngr.inserted_appctx():
                     yield
             else:
                 yield
         finally:
+            if stage is not None:
+                stage.pop()
+            used_options = self._used_options
             for k in self.to_delete:
-                if self.options_object.used(self.options_prefix + k):
-                    self._used_options.add(k)
-                del self.options_object[self.options_prefix + k]
+                option = self.options_prefix + k
+                if (
+                    used_options is not None
+                    and self.options_object.used(option)
+                ):
+                    used_options.add(k)
+                del self.options_object[option]
+            if monitor is not None:
+                monitor._record_delete(
+                    self.options_prefix, self.parameters, self.to_delete,
+                    len(self.to_delete) if used_options is not None else 0,
+                )
 
-    @functools.cached_property
+    @property
     def options_object(self):
-        from petsc4py import PETSc
+        return _get_options_object()
+
 
-        return PETSc.Options()
+@functools.cache
+def _get_options_object():
+    """Return the global options database, shared by all managers."""
+    from petsc4py import PETSc
+
+    return PETSc.Options()
 
 
 def petscobj2str(obj: petsc4py.PETSc.Object) -> str:
@@ -650,9 +1146,7 @@ def has_options(obj: petsc4py.PETSc.Object) -> bool:
     attach_options
     set_from_options
     """
-    return "options" in obj.getDict() and isinstance(
-        obj.getAttr("options"), OptionsManager
-    )
+    return isinstance(obj.getAttr("options"), OptionsManager)
 
 
 def get_options(obj: petsc4py.PETSc.Object) -> OptionsManager:
@@ -678,11 +1172,13 @@ def get_options(obj: petsc4py.PETSc.Object) -> OptionsManager:
     attach_options
     set_from_options
     """
-    if not has_options(obj):
+    # Only look up the attribute once since this is called frequently
+    options = obj.getAttr("options")
+    if not isinstance(options, OptionsManager):
         raise PetscToolsException(
-            "No OptionsManager attached to {petscobj2str(obj)}"
+            f"No OptionsManager attached to {petscobj2str(obj)}"
         )
-    return obj.getAttr("options")
+    return options
 
 
 def set_default_parameter(
@@ -1,6 +1,7 @@
 import abc
 
 from .exceptions import PetscToolsException
+from .utils import _WorkVecPool
 
 
 class PCBase(abc.ABC):
@@ -26,6 +27,26 @@ class PCBase(abc.ABC):
        preconditioner is updated. The ``setUp`` method will call the user
        implemented ``initialize`` method only on the first time it is called,
        but will call the ``update`` method on every subsequent call.
+       PETSc does not call ``setUp`` if the preconditioning matrix is
+       unchanged or the preconditioner is being reused (e.g. when a SNES
+       lags the preconditioner), so ``update`` is not called in these
+       cases.
+
+    3. Profiling the preconditioner.
+
+       If the ``log_events`` attribute is set, or the option
+       ``-{full_prefix}log_events`` is passed, then PETSc log events are
+       registered for each phase of the preconditioner (``initialize``,
+       ``update``, ``apply``, ``applyTranspose`` and ``matApply``). These
+       are named after the class and ``full_prefix`` so that ``-log_view``
+       reports the time spent in each Python preconditioner separately.
+
+    4. Providing temporary vectors.
+
+       The ``get_work_vec`` method returns a vector with the same layout
+       as a template vector. These vectors are created once and reused
+       between calls, avoiding allocating new vectors each time the
+       preconditioner is applied.
 
     Inheriting classes should also set the ``prefix`` attribute.
     The attributes ``parent_prefix`` and ``full_prefix`` will then be set,
@@ -39,11 +60,17 @@ class PCBase(abc.ABC):
     * ``update``
     * ``apply``
 
+    and may optionally implement:
+
+    * ``applyTranspose``
+    * ``matApply`` (defaults to calling ``apply`` on each column).
+
     They should also set the following class attributes:
 
     * ``prefix``
     * ``needs_python_amat`` (optional, defaults to False).
     * ``needs_python_pmat`` (optional, defaults to False).
+    * ``log_events`` (optional, defaults to False).
 
     Notes
     -----
@@ -64,8 +91,17 @@ class PCBase(abc.ABC):
     prefix = None
     """The options prefix of this PC."""
 
+    log_events = False
+    """Set this to True to time each phase of this PC with PETSc log events."""
+
+    logged_methods = (
+        "initialize", "update", "apply", "applyTranspose", "matApply"
+    )
+    """The methods that are timed if log events are enabled."""
+
     def __init__(self):
         self.initialized = False
+        self._work_vecs = _WorkVecPool()
 
     def setUp(self, pc):
         """Called by PETSc to update the PC.
@@ -102,9 +138,51 @@ class PCBase(abc.ABC):
             if not self.full_prefix.endswith("_"):
                 self.full_prefix += "_"
 
+            self._add_work_vec_release()
+            if self.log_events or self._log_events_option():
+                self._add_log_events()
+
             self.initialize(pc)
             self.initialized = True
 
+    def get_work_vec(self, template):
+        """Return a work vector with the same layout as template.
+
+        Work vectors are created the first time they are requested and are
+        then reused. Repeated requests within a single call to
+        ``initialize``, ``update``, ``apply``, ``applyTranspose`` or
+        ``matApply`` return distinct vectors, which are returned to the pool
+        at the end of the call. The contents of the vector are undefined.
+
+        Parameters
+        ----------
+        template
+            The PETSc Vec whose layout should be matched.
+
+        Returns
+        -------
+            A PETSc Vec with the same type and sizes as ``template``.
+        """
+        return self._work_vecs.get(template)
+
+    def _add_work_vec_release(self):
+        """Return any work vectors to the pool at the end of each call."""
+        for method in self.logged_methods:
+            setattr(self, method,
+                    self._work_vecs.release_after(getattr(self, method)))
+
+    def _log_events_option(self):
+        from petsc4py import PETSc
+        return PETSc.Options().getBool(self.full_prefix + "log_events", False)
+
+    def _add_log_events(self):
+        """Wrap the methods of this PC in PETSc log events."""
+        from .log import wrap_log_event
+        name = f"{type(self).__name__}({self.full_prefix})"
+        for method in self.logged_methods:
+            setattr(self, method, wrap_log_event(getattr(self, method),
+                                                 f"{name}.{method}"))
+
     @abc.abstractmethod
     def initialize(self, pc):
         """Initialize any state in this preconditioner.
@@ -139,6 +217,36 @@ class PCBase(abc.ABC):
         raise NotImplementedError(
             "Need to implement the transpose action of this PC")
 
+    def matApply(self, pc, X, Y):
+        """Apply the preconditioner to the columns of X, putting the result
+        in the columns of Y.
+
+        Both X and Y are dense PETSc Mats, Y is not guaranteed to be zero on
+        entry. This is called by block Krylov methods and when solving with
+        multiple right hand sides (e.g. ``ksp.matSolve``).
+
+        The default implementation calls ``apply`` for each column in turn.
+        Preconditioners that can act on many vectors at once should override
+        this method, for example operating on ``X.getDenseArray(True)`` and
+        ``Y.getDenseArray()`` with NumPy.
+        """
+        for i in range(X.getSize()[1]):
+            x = X.getDenseColumnVec(i, "r")
+            y = Y.getDenseColumnVec(i, "w")
+            try:
+                self.apply(pc, x, y)
+            finally:
+                X.restoreDenseColumnVec(i, "r")
+                Y.restoreDenseColumnVec(i, "w")
+
+    def destroy(self, pc):
+        """Called by PETSc when the PC is destroyed.
+
+        Inheriting classes that override this method must call
+        ``super().destroy(pc)``.
+        """
+        self._work_vecs.destroy()
+
     def view(self, pc, viewer=None):
         """Write a basic description of this PC.
         """
@@ -0,0 +1,49 @@
+"""Pytest fixtures for isolating tests that use the PETSc options database.
+
+The plugin is not enabled automatically. To use the fixtures, add the
+following to a ``conftest.py``:
+
+.. code-block:: python3
+
+    pytest_plugins = ["petsctools.pytest_plugin"]
+"""
+
+import pytest
+
+import petsctools
+
+
+def _ensure_initialized():
+    """Initialise PETSc with petsctools, unless already initialised."""
+    import petsc4py.lib
+
+    # Importing petsc4py.PETSc would initialise PETSc without petsctools
+    if not petsc4py.lib.ImportPETSc().Sys.isInitialized():
+        petsctools.init()
+
+
+@pytest.fixture
+def isolated_petsc_options():
+    """Restore the PETSc options database and AppContext after the test.
+
+    See :func:`petsctools.testing.isolated_options`.
+    """
+    from petsctools.testing import isolated_options
+
+    _ensure_initialized()
+    with isolated_options() as snapshot:
+        yield snapshot
+
+
+@pytest.fixture
+def clean_petsc_options():
+    """Run the test with empty PETSc options and AppContext databases.
+
+    The databases are restored after the test. See
+    :func:`petsctools.testing.isolated_options`.
+    """
+    from petsctools.testing import isolated_options
+
+    _ensure_initialized()
+    with isolated_options(clear=True) as snapshot:
+        yield snapshot
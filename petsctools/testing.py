@@ -0,0 +1,92 @@
+"""Utilities for isolating tests that use the PETSc options database."""
+
+from __future__ import annotations
+
+import contextlib
+from collections.abc import Iterator
+
+import petsc4py
+
+from petsctools import appctx
+
+
+class OptionsSnapshot:
+    """A saved state of the PETSc options database and AppContext storage.
+
+    Parameters
+    ----------
+    options
+        The options database to snapshot. Defaults to the global database.
+
+    See Also
+    --------
+    isolated_options
+    """
+
+    def __init__(self, options: petsc4py.PETSc.Options | None = None):
+        if options is None:
+            from petsc4py import PETSc
+
+            options = PETSc.Options()
+        self.options = options
+        self._options = options.getAll()
+        self._appctx_data = dict(appctx._global_appctx_data)
+
+    def restore(self) -> None:
+        """Return the options database and AppContext to the saved state.
+
+        Only options that differ from the snapshot are changed, so
+        restoring an options database that was not modified makes no
+        insertions or deletions.
+        """
+        current = self.options.getAll()
+        for option in current.keys() - self._options.keys():
+            del self.options[option]
+        for option, value in self._options.items():
+            if option not in current or current[option] != value:
+                self.options[option] = value
+
+        # Values may not support comparison (e.g. NumPy arrays) so always
+        # replace them
+        appctx._global_appctx_data.clear()
+        appctx._global_appctx_data.update(self._appctx_data)
+
+
+@contextlib.contextmanager
+def isolated_options(clear: bool = False) -> Iterator[OptionsSnapshot]:
+    """Context manager that restores the global options on exit.
+
+    Both the global PETSc options database and the storage behind
+    :class:`~petsctools.appctx.AppContext` are returned to their state on
+    entry, so that options set inside the block do not leak into other
+    code.
+
+    Parameters
+    ----------
+    clear
+        Whether to start from empty databases, for example to stop options
+        from a ``petscrc`` file or the command line affecting a test.
+
+    Yields
+    ------
+        The snapshot of the databases on entry.
+
+    Notes
+    -----
+    petsc4py does not expose ``PetscOptionsPush``, so the database is
+    restored by comparing it to a copy taken on entry.
+
+    See Also
+    --------
+    OptionsSnapshot
+    """
+    snapshot = OptionsSnapshot()
+    if clear:
+        # Options.clear is a no-op for the global database
+        for option in snapshot._options:
+            del snapshot.options[option]
+        appctx._global_appctx_data.clear()
+    try:
+        yield snapshot
+    finally:
+        snapshot.restore()
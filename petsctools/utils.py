@@ -1,6 +1,75 @@
+import functools
+
 try:
     import petsc4py  # noqa: F401
 
     PETSC4PY_INSTALLED = True
 except ImportError:
     PETSC4PY_INSTALLED = False
+
+
+class _WorkVecPool:
+    """A pool of temporary vectors that are reused between calls.
+
+    Vectors are handed out by :meth:`get` and are only returned to the pool
+    when :meth:`restore` is called with a checkpoint taken before they were
+    handed out.
+    """
+
+    def __init__(self):
+        self._vecs = {}
+        self._in_use = {}
+        # The keys of the vectors handed out, in order
+        self._handed_out = []
+
+    def get(self, template):
+        """Return a vector with the same layout as ``template``.
+
+        The contents of the vector are undefined.
+        """
+        key = (template.getType(), template.getSizes(),
+               template.getBlockSize())
+        vecs = self._vecs.setdefault(key, [])
+        n = self._in_use.get(key, 0)
+        if n == len(vecs):
+            vecs.append(template.duplicate())
+        self._in_use[key] = n + 1
+        self._handed_out.append(key)
+        return vecs[n]
+
+    def checkpoint(self):
+        """Return a marker of the vectors currently handed out."""
+        return len(self._handed_out)
+
+    def restore(self, checkpoint):
+        """Return vectors handed out since ``checkpoint`` to the pool."""
+        for key in self._handed_out[checkpoint:]:
+            self._in_use[key] -= 1
+        del self._handed_out[checkpoint:]
+
+    def release_after(self, func):
+        """Wrap ``func`` so that vectors handed out during each call are
+        returned to the pool when it returns.
+        """
+        # This is called for every application of a preconditioner or
+        # operator so only do the minimum if no vectors are handed out.
+        handed_out = self._handed_out
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            checkpoint = len(handed_out)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if len(handed_out) > checkpoint:
+                    self.restore(checkpoint)
+        return wrapper
+
+    def destroy(self):
+        """Destroy all of the vectors in the pool."""
+        for vecs in self._vecs.values():
+            for vec in vecs:
+                vec.destroy()
+        self._vecs.clear()
+        self._in_use.clear()
+        self._handed_out.clear()
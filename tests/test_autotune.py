@@ -0,0 +1,88 @@
+import pytest
+
+import petsctools
+
+
+def make_problem(PETSc, comm):
+    n = 10
+    mat = PETSc.Mat().createConstantDiagonal(((None, n), (None, n)), 2.0,
+                                             comm=comm)
+    b, x = mat.createVecs()
+    b.set(1.0)
+
+    def factory(comm):
+        ksp = PETSc.KSP().create(comm=comm)
+        ksp.setOperators(mat)
+        return ksp
+
+    def workload(ksp):
+        ksp.solve(b, x)
+
+    return factory, workload
+
+
+CANDIDATES = [
+    {"ksp_type": "cg", "pc_type": "jacobi"},
+    {"ksp": {"type": "gmres"}, "pc_type": "none"},
+]
+
+
+@pytest.mark.skipnopetsc4py
+def test_autotune(tmp_path):
+    PETSc = petsctools.init()
+    factory, workload = make_problem(PETSc, PETSc.COMM_SELF)
+
+    filename = tmp_path / "autotune.json"
+    results = petsctools.autotune(
+        factory, CANDIDATES, workload, comm=PETSc.COMM_SELF, repeats=2,
+        filename=str(filename),
+    )
+
+    assert len(results) == 2
+    assert results[0][0] <= results[1][0]
+    assert {"ksp_type": "gmres", "pc_type": "none"} in [
+        parameters for _, parameters in results
+    ]
+    assert petsctools.load_autotune_results(str(filename)) == results
+
+
+@pytest.mark.skipnopetsc4py
+def test_split_comm():
+    pytest.importorskip("mpi4py")
+    from petsctools.autotune import _split_comm
+
+    PETSc = petsctools.init()
+    comm = PETSc.COMM_WORLD
+    nsubcomms = min(2, comm.getSize())
+    # Leaving the context must free the split communicator without
+    # trying to destroy it through PETSc, which does not own it
+    with _split_comm(comm, nsubcomms) as (subcomm, color):
+        assert color == comm.getRank() % nsubcomms
+        assert subcomm.getSize() == len(
+            range(color, comm.getSize(), nsubcomms)
+        )
+
+
+@pytest.mark.skipnopetsc4py
+def test_autotune_subcomms():
+    pytest.importorskip("mpi4py")
+    PETSc = petsctools.init()
+    comm = PETSc.COMM_WORLD
+    if comm.getSize() < 2:
+        pytest.skip("Splitting the candidates needs at least 2 ranks")
+
+    # Each rank builds its own problem on its sub-communicator
+    def factory(subcomm):
+        factory, _ = make_problem(PETSc, subcomm)
+        return factory(subcomm)
+
+    def workload(ksp):
+        b, x = ksp.getOperators()[0].createVecs()
+        b.set(1.0)
+        ksp.solve(b, x)
+
+    results = petsctools.autotune(
+        factory, CANDIDATES, workload, comm=comm, nsubcomms=2
+    )
+    assert len(results) == 2
+    assert all(time < float("inf") for time, _ in results)
@@ -0,0 +1,32 @@
+import pytest
+
+import petsctools
+
+
+@pytest.mark.skipnopetsc4py
+def test_object_cache():
+    PETSc = petsctools.init()
+    comm = PETSc.COMM_SELF
+    cache = petsctools.ObjectCache(maxsize=2)
+    setups = []
+
+    cg = cache.get(PETSc.KSP, comm, {"ksp_type": "cg"}, setup=setups.append)
+    assert cg.getType() == "cg"
+    assert petsctools.is_set_from_options(cg)
+    assert cache.get(PETSc.KSP, comm, {"ksp": {"type": "cg"}}) is cg
+    assert setups == [cg]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    gmres = cache.get(PETSc.KSP, comm, {"ksp_type": "gmres"})
+    assert gmres is not cg
+
+    # cg was used more recently than gmres so gmres is evicted
+    cache.get(PETSc.KSP, comm, {"ksp_type": "cg"})
+    cache.get(PETSc.KSP, comm, {"ksp_type": "richardson"})
+    assert len(cache) == 2
+    assert gmres.handle == 0
+    assert cache.get(PETSc.KSP, comm, {"ksp_type": "cg"}) is cg
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cg.handle == 0
@@ -13,3 +13,107 @@ def test_cannot_cite_nonexistent_citation():
 def test_cite_citation():
     petsctools.add_citation("mykey", "myentry")
     petsctools.cite("mykey")
+
+
+@pytest.mark.skipnopetsc4py
+def test_cite_registers_citation_once():
+    from petsctools.citation import _registered_citations
+
+    petsctools.add_citation("oncekey", "onceentry")
+    assert "oncekey" not in _registered_citations
+
+    petsctools.cite("oncekey")
+    assert "oncekey" in _registered_citations
+    petsctools.cite("oncekey")
+
+    # Changing the entry means that it must be registered again
+    petsctools.add_citation("oncekey", "newentry")
+    assert "oncekey" not in _registered_citations
+
+
+@pytest.mark.skipnopetsc4py
+def test_cite_many():
+    from petsctools.citation import _registered_citations
+
+    petsctools.add_citation("manykey1", "manyentry1")
+    petsctools.add_citation("manykey2", "manyentry2")
+
+    with pytest.raises(KeyError):
+        petsctools.cite_many(["manykey1", "nonexistent"])
+    assert "manykey1" not in _registered_citations
+
+    petsctools.cite_many(["manykey1", "manykey2", "manykey1"])
+    assert {"manykey1", "manykey2"} <= _registered_citations
+
+
+BIBTEX = """
+@comment{This is not an entry}
+@article{lazykey1,
+  title = {A {Nested} Title},
+  year = {2025},
+}
+
+@book{lazykey2,
+  title = {Another Title},
+}
+"""
+
+
+@pytest.mark.skipnopetsc4py
+@pytest.mark.parametrize("with_keys", [True, False])
+def test_add_citation_file(tmp_path, with_keys):
+    from petsctools.citation import _citations_database
+
+    path = tmp_path / "refs.bib"
+    path.write_text(BIBTEX)
+
+    cite_keys = ("lazykey1", "lazykey2") if with_keys else None
+    petsctools.add_citation_file(path, cite_keys)
+
+    petsctools.cite("lazykey1")
+    assert _citations_database["lazykey1"].startswith("@article{lazykey1,")
+    assert _citations_database["lazykey1"].endswith("year = {2025},\n}")
+    assert _citations_database["lazykey2"].startswith("@book{lazykey2,")
+
+
+@pytest.mark.skipnopetsc4py
+def test_add_citation_loader():
+    calls = []
+
+    def loader():
+        calls.append(None)
+        return "loadedentry"
+
+    petsctools.add_citation("loaderkey", loader)
+    assert not calls
+    petsctools.cite("loaderkey")
+    petsctools.cite("loaderkey")
+    assert len(calls) == 1
+
+
+@pytest.mark.skipnopetsc4py
+def test_citation_file_entry_without_key(tmp_path):
+    from petsctools.citation import _read_citation_file
+
+    path = tmp_path / "refs.bib"
+    path.write_text("@misc{nokey}\n\n@book{haskey,\n  title = {Title},\n}\n")
+    with pytest.raises(ValueError, match="does not have a key"):
+        _read_citation_file(path)
+
+
+@pytest.mark.skipnopetsc4py
+def test_citation_file_ignores_text_between_entries(tmp_path):
+    from petsctools.citation import _read_citation_file
+
+    path = tmp_path / "refs.bib"
+    path.write_text(
+        "% contact: someone@example.org\n"
+        "@article{key1,\n  title = {A (bracketed) title},\n}\n"
+        "Text with an @ sign.\n"
+        "@book(key2, title = {Title})\n"
+    )
+    entries = _read_citation_file(path)
+    assert entries == {
+        "key1": "@article{key1,\n  title = {A (bracketed) title},\n}",
+        "key2": "@book(key2, title = {Title})",
+    }
@@ -0,0 +1,42 @@
+import pytest
+
+import petsctools
+
+
+@pytest.mark.skipnopetsc4py
+def test_init_profile():
+    PETSc = petsctools.init(profile=True)
+
+    profile = petsctools.get_init_profile()
+    assert list(profile) == [
+        "initialize",
+        "check_environment",
+        "check_version",
+        "commandline_options",
+    ]
+    for stats in profile.values():
+        assert stats["min"] == stats["max"] == stats["mean"] >= 0
+
+    reduced = petsctools.get_init_profile(PETSc.COMM_WORLD)
+    assert reduced.keys() == profile.keys()
+    for stats in reduced.values():
+        assert stats["min"] <= stats["mean"] <= stats["max"]
+
+
+@pytest.mark.skipnopetsc4py
+def test_init_checks_are_cached():
+    from petsctools.init import (
+        _check_environment_matches_petsc4py_config,
+        _check_petsc_version,
+    )
+
+    petsctools.init(version_spec=">=3.0")
+    env_hits = _check_environment_matches_petsc4py_config.cache_info().hits
+    version_hits = _check_petsc_version.cache_info().hits
+
+    petsctools.init(version_spec=">=3.0")
+    assert (
+        _check_environment_matches_petsc4py_config.cache_info().hits
+        == env_hits + 1
+    )
+    assert _check_petsc_version.cache_info().hits == version_hits + 1
@@ -0,0 +1,162 @@
+import pytest
+
+import petsctools
+
+
+@pytest.mark.skipnopetsc4py
+def test_get_coo_preallocation():
+    import numpy as np
+
+    # Rows 2 and 3 are owned and columns 2 to 4 are in the diagonal block
+    rows = np.array([2, 2, 2, 3, 3, 3, 0, -1])
+    cols = np.array([2, 2, 5, 0, 3, 4, 0, 2])
+    d_nnz, o_nnz = petsctools.get_coo_preallocation(
+        rows, cols, (2, 4), (2, 5)
+    )
+    assert list(d_nnz) == [1, 2]
+    assert list(o_nnz) == [1, 1]
+
+
+@pytest.mark.skipnopetsc4py
+def test_set_values_coo():
+    import numpy as np
+
+    PETSc = petsctools.init()
+
+    mat = PETSc.Mat().create(comm=PETSc.COMM_SELF)
+    mat.setSizes((3, 3))
+    mat.setType(PETSc.Mat.Type.AIJ)
+
+    rows = np.array([0, 1, 2, 0, 2])
+    cols = np.array([0, 1, 2, 2, 2])
+    values = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    petsctools.set_values_coo(mat, rows, cols, values)
+
+    expected = np.array([
+        [1.0, 0.0, 4.0],
+        [0.0, 2.0, 0.0],
+        [0.0, 0.0, 8.0],
+    ])
+    assert np.allclose(mat.convert(PETSc.Mat.Type.DENSE).getDenseArray(),
+                       expected)
+
+
+@pytest.mark.skipnopetsc4py
+def test_mat_base():
+    PETSc = petsctools.init()
+
+    class ScaleMat(petsctools.MatBase):
+        cache_diagonal = True
+
+        def __init__(self, scale):
+            super().__init__()
+            self.scale = scale
+            self.diagonal_computations = 0
+
+        def mult(self, mat, x, y):
+            x.copy(y)
+            y.scale(self.scale)
+
+        def compute_diagonal(self, mat, d):
+            self.diagonal_computations += 1
+            d.set(self.scale)
+
+    n = 4
+    ctx = ScaleMat(3.0)
+    mat = PETSc.Mat().createPython(((n, n), (n, n)), context=ctx,
+                                   comm=PETSc.COMM_SELF)
+    mat.setUp()
+
+    x, y = mat.createVecs()
+    x.set(1.0)
+    y.set(2.0)
+    mat.multAdd(x, y, y)
+    assert (y.array == 5.0).all()
+
+    d = mat.getDiagonal()
+    mat.getDiagonal(d)
+    assert (d.array == 3.0).all()
+    assert ctx.diagonal_computations == 1
+
+    ctx.scale = 4.0
+    mat.assemble()
+    mat.getDiagonal(d)
+    assert (d.array == 4.0).all()
+    assert ctx.diagonal_computations == 2
+
+    X = PETSc.Mat().createDense((n, 2), comm=PETSc.COMM_SELF)
+    X.setUp()
+    X.setRandom()
+    Y = X.duplicate()
+    ctx.matMult(mat, X, Y)
+    assert (Y.getDenseArray() == 4.0 * X.getDenseArray()).all()
+
+
+@pytest.mark.skipnopetsc4py
+def test_mat_base_mat_product():
+    PETSc = petsctools.init()
+
+    class ScaleMat(petsctools.MatBase):
+        def __init__(self):
+            super().__init__()
+            self.mat_mults = 0
+
+        def mult(self, mat, x, y):
+            x.copy(y)
+            y.scale(2.0)
+
+        def matMult(self, mat, X, Y):
+            self.mat_mults += 1
+            super().matMult(mat, X, Y)
+
+    n = 4
+    ctx = ScaleMat()
+    mat = PETSc.Mat().createPython(((n, n), (n, n)), context=ctx,
+                                   comm=PETSc.COMM_SELF)
+    mat.setUp()
+
+    X = PETSc.Mat().createDense((n, 3), comm=PETSc.COMM_SELF)
+    X.setUp()
+    X.setRandom()
+    Y = mat.matMult(X)
+    assert ctx.mat_mults == 1
+    assert Y.getSize() == (n, 3)
+    assert (Y.getDenseArray() == 2.0 * X.getDenseArray()).all()
+
+    # Reuse the result
+    X.scale(2.0)
+    mat.matMult(X, Y)
+    assert ctx.mat_mults == 2
+    assert (Y.getDenseArray() == 2.0 * X.getDenseArray()).all()
+
+
+@pytest.mark.skipnopetsc4py
+def test_mat_base_log_events_prefix():
+    from petsctools.log import _log_events
+
+    PETSc = petsctools.init()
+    # Performance information is only collected by the default log handler
+    PETSc.Log.begin()
+
+    class IdentityMat(petsctools.MatBase):
+        def mult(self, mat, x, y):
+            x.copy(y)
+
+    n = 4
+    mat = PETSc.Mat().createPython(((n, n), (n, n)), context=IdentityMat(),
+                                   comm=PETSc.COMM_SELF)
+    mat.setOptionsPrefix("logged_")
+    mat.setUp()
+
+    x, y = mat.createVecs()
+    options = PETSc.Options()
+    options["logged_log_events"] = True
+    try:
+        mat.mult(x, y)
+        mat.mult(x, y)
+    finally:
+        del options["logged_log_events"]
+
+    name = "IdentityMat(logged_).mult"
+    assert name in _log_events
+    assert _log_events[name].getPerfInfo()["count"] == 2
@@ -3,6 +3,7 @@ import warnings
 import pytest
 
 import petsctools
+from petsctools.exceptions import PetscToolsWarning
 
 
 @pytest.fixture(autouse=True, scope="module")
@@ -172,3 +173,166 @@ def test_inserted_options_dict():
     with petsctools.inserted_options(parameters=params, options_prefix=prefix):
         assert PETSc.Options().getInt("prefix_opt_int") == 3
         assert PETSc.Options().getBool("prefix_opt_flag")
+
+
+@pytest.mark.skipnopetsc4py
+def test_commandline_options_with_prefix():
+    from petsctools.options import CommandlineOptions
+
+    options = CommandlineOptions(
+        ["b_opt", "a_opt2", "ab_opt", "a_opt1", "c_opt"]
+    )
+    assert len(options) == 5
+    assert "a_opt1" in options
+    assert "a_opt" not in options
+    assert options == {"a_opt1", "a_opt2", "ab_opt", "b_opt", "c_opt"}
+
+    assert options.with_prefix("a_") == ("a_opt1", "a_opt2")
+    assert options.with_prefix("a") == ("a_opt1", "a_opt2", "ab_opt")
+    assert options.with_prefix("d_") == ()
+    assert options.with_prefix("") == tuple(sorted(options))
+
+
+@pytest.mark.skipnopetsc4py
+@pytest.mark.parametrize("options_left", (0, 1))
+def test_unused_options_empty_prefix(options_left):
+    """Check that -options_left may be passed as a parameter."""
+    from petsc4py import PETSc
+
+    options = petsctools.OptionsManager(
+        {"options_left": options_left, "not_used": 2}, options_prefix=""
+    )
+    # The parameters must not be left in the database
+    assert "not_used" not in PETSc.Options().getAll()
+
+    if options_left:
+        with pytest.warns(PetscToolsWarning):
+            del options
+    else:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            del options
+
+
+@pytest.mark.skipnopetsc4py
+def test_unused_options_report(monkeypatch, capfd):
+    """Check that unused options are collected into a single report."""
+    from petsc4py import PETSc
+
+    import petsctools.options
+
+    monkeypatch.setattr(petsctools.options, "_unused_options_report", set())
+    PETSc.Options()["options_left"] = 1
+
+    dead = petsctools.OptionsManager({"dead_opt": 1}, options_prefix="dead")
+    alive = petsctools.OptionsManager({"alive_opt": 1},
+                                      options_prefix="alive")
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        del dead
+
+    petsctools.report_unused_options(comm=PETSc.COMM_SELF)
+    PETSc.Sys.syncFlush()
+    out, _ = capfd.readouterr()
+    assert "dead_dead_opt" in out
+    assert "alive_alive_opt" in out
+    assert out.count("Unused PETSc options") == 1
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        del alive
+
+
+@pytest.mark.skipnopetsc4py
+def test_options_manager_is_compact():
+    from petsctools.testing import isolated_options
+
+    # Make sure that -options_left is not set by an earlier test
+    with isolated_options(clear=True):
+        options = petsctools.OptionsManager(
+            {"opt": 1}, options_prefix="compact"
+        )
+    assert not hasattr(options, "__dict__")
+    # Used options are only tracked if unused options are reported
+    assert options._used_options is None
+
+
+@pytest.mark.skipnopetsc4py
+def test_recycle_default_prefixes():
+    import gc
+
+    petsctools.recycle_default_prefixes()
+    try:
+        first = petsctools.OptionsManager({}, default_prefix="recycle")
+        second = petsctools.OptionsManager({}, default_prefix="recycle")
+        prefix = first.options_prefix
+        assert prefix != second.options_prefix
+
+        del first
+        gc.collect()
+        third = petsctools.OptionsManager({}, default_prefix="recycle")
+        assert third.options_prefix == prefix
+    finally:
+        petsctools.recycle_default_prefixes(False)
+
+    fourth = petsctools.OptionsManager({}, default_prefix="recycle")
+    assert fourth.options_prefix not in {prefix, second.options_prefix}
+
+
+@pytest.mark.skipnopetsc4py
+def test_options_monitor(capfd):
+    monitor = petsctools.monitor_options(sample_every=1)
+    try:
+        assert petsctools.get_options_monitor() is monitor
+        options = petsctools.OptionsManager(
+            {"ksp_type": "cg", "pc_type": "jacobi"}, options_prefix="monitor"
+        )
+        with options.inserted_options():
+            assert monitor.live_options == {
+                "monitor_ksp_type", "monitor_pc_type"
+            }
+        with options.inserted_options():
+            pass
+
+        assert monitor.insertions["monitor_"] == 4
+        assert monitor.deletions["monitor_"] == 4
+        assert monitor.high_water_mark == 2
+        assert not monitor.live_options
+        assert not monitor.leak_suspects
+        assert len(monitor.samples) == 2
+
+        monitor.report()
+        assert "monitor_" in capfd.readouterr().out
+    finally:
+        petsctools.monitor_options(False)
+    assert petsctools.get_options_monitor() is None
+
+
+@pytest.mark.skipnopetsc4py
+def test_use_log_stages():
+    from petsctools.log import get_log_event, get_log_stage
+
+    PETSc = petsctools.init()
+    # Performance information is only collected by the default log handler
+    PETSc.Log.begin()
+
+    stage = get_log_stage("staged_")
+    assert stage.getName() == "staged_"
+    assert get_log_stage("staged_") is stage
+
+    event = get_log_event("test_use_log_stages")
+    options = petsctools.OptionsManager({}, options_prefix="staged")
+    petsctools.use_log_stages()
+    try:
+        with options.inserted_options():
+            event.begin()
+            event.end()
+    finally:
+        petsctools.use_log_stages(False)
+    # The stage is popped on exit
+    event.begin()
+    event.end()
+
+    assert event.getPerfInfo(stage.id)["count"] == 1
+    assert event.getPerfInfo()["count"] == 1
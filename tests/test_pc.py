@@ -0,0 +1,148 @@
+import pytest
+
+import petsctools
+from petsctools.pc import PCBase
+
+
+class ScalePC(PCBase):
+    prefix = "scale_"
+
+    def initialize(self, pc):
+        self.scale = 2.0
+
+    def update(self, pc):
+        pass
+
+    def apply(self, pc, x, y):
+        x.copy(y)
+        y.scale(self.scale)
+
+
+class CountingScalePC(ScalePC):
+    def initialize(self, pc):
+        super().initialize(pc)
+        self.updates = 0
+
+    def update(self, pc):
+        self.updates += 1
+
+
+class MatApplyScalePC(ScalePC):
+    def initialize(self, pc):
+        super().initialize(pc)
+        self.mat_applies = 0
+
+    def matApply(self, pc, X, Y):
+        self.mat_applies += 1
+        super().matApply(pc, X, Y)
+
+
+class WorkVecPC(ScalePC):
+    def initialize(self, pc):
+        super().initialize(pc)
+        self.work_vecs = []
+
+    def apply(self, pc, x, y):
+        w1 = self.get_work_vec(x)
+        w2 = self.get_work_vec(x)
+        self.work_vecs.append((w1, w2))
+        x.copy(w1)
+        w1.scale(self.scale)
+        w1.copy(y)
+
+
+def make_ksp(PETSc, n=4, pc_type="ScalePC"):
+    mat = PETSc.Mat().createConstantDiagonal(((n, n), (n, n)), 1.0,
+                                             comm=PETSc.COMM_SELF)
+    ksp = PETSc.KSP().create(comm=PETSc.COMM_SELF)
+    ksp.setOperators(mat, mat)
+    petsctools.set_from_options(
+        ksp,
+        parameters={
+            "ksp_type": "preonly",
+            "pc_type": "python",
+            "pc_python_type": f"{__name__}.{pc_type}",
+        },
+        options_prefix="pctest",
+    )
+    return ksp
+
+
+@pytest.mark.skipnopetsc4py
+def test_pc_mat_apply():
+    PETSc = petsctools.init()
+    ksp = make_ksp(PETSc, pc_type="MatApplyScalePC")
+
+    B = PETSc.Mat().createDense((4, 3), comm=PETSc.COMM_SELF)
+    B.setUp()
+    B.setRandom()
+    X = B.duplicate()
+
+    with petsctools.inserted_options(ksp):
+        ksp.matSolve(B, X)
+
+    assert ksp.getPC().getPythonContext().mat_applies == 1
+    assert (X.getDenseArray() == 2 * B.getDenseArray()).all()
+
+
+@pytest.mark.skipnopetsc4py
+def test_pc_log_events():
+    from petsctools.log import _log_events
+
+    PETSc = petsctools.init()
+    PETSc.Log.begin()
+    ksp = make_ksp(PETSc)
+    petsctools.set_default_parameter(ksp, "scale_log_events", None)
+
+    x, b = ksp.getOperators()[0].createVecs()
+    b.set(1)
+    with petsctools.inserted_options(ksp):
+        ksp.solve(b, x)
+
+    name = "ScalePC(pctest_scale_).apply"
+    assert name in _log_events
+    assert _log_events[name].getPerfInfo()["count"] == 1
+
+
+@pytest.mark.skipnopetsc4py
+def test_pc_update_only_when_pmat_changes():
+    PETSc = petsctools.init()
+    ksp = make_ksp(PETSc, pc_type="CountingScalePC")
+    pc = ksp.getPC()
+    x, b = ksp.getOperators()[0].createVecs()
+    b.set(1)
+
+    with petsctools.inserted_options(ksp):
+        ksp.solve(b, x)
+        ctx = pc.getPythonContext()
+
+        # PETSc does not set up the PC again if the operators are unchanged
+        ksp.solve(b, x)
+        assert ctx.updates == 0
+
+        # Modifying the operator means that the PC must be updated
+        pc.getOperators()[1].scale(2.0)
+        ksp.solve(b, x)
+        assert ctx.updates == 1
+
+
+@pytest.mark.skipnopetsc4py
+def test_pc_work_vecs():
+    PETSc = petsctools.init()
+    ksp = make_ksp(PETSc, pc_type="WorkVecPC")
+
+    x, b = ksp.getOperators()[0].createVecs()
+    b.set(1)
+    with petsctools.inserted_options(ksp):
+        ksp.solve(b, x)
+        ksp.solve(b, x)
+    assert (x.array == 2).all()
+
+    ctx = ksp.getPC().getPythonContext()
+    (w1, w2), (v1, v2) = ctx.work_vecs
+    # Vectors are distinct within a single apply but reused between them
+    assert w1.handle != w2.handle
+    assert w1.handle == v1.handle and w2.handle == v2.handle
+
+    ksp.destroy()
+    assert w1.handle == 0
@@ -0,0 +1,75 @@
+import pytest
+
+import petsctools
+
+pytest_plugins = ["petsctools.pytest_plugin"]
+
+
+@pytest.mark.skipnopetsc4py
+def test_isolated_options():
+    from petsctools.appctx import _global_appctx_data
+    from petsctools.testing import isolated_options
+
+    PETSc = petsctools.init()
+    options = PETSc.Options()
+    options["isolated_kept"] = "a"
+    options["isolated_changed"] = "b"
+    try:
+        with isolated_options():
+            options["isolated_changed"] = "c"
+            options["isolated_added"] = "d"
+            del options["isolated_kept"]
+            _global_appctx_data["isolated_key"] = object()
+
+        assert options.getString("isolated_kept") == "a"
+        assert options.getString("isolated_changed") == "b"
+        assert not options.hasName("isolated_added")
+        assert "isolated_key" not in _global_appctx_data
+
+        with isolated_options(clear=True):
+            assert not options.hasName("isolated_kept")
+        assert options.getString("isolated_kept") == "a"
+    finally:
+        del options["isolated_kept"]
+        del options["isolated_changed"]
+
+
+@pytest.mark.skipnopetsc4py
+def test_isolated_options_uncomparable_appctx():
+    from petsctools.appctx import _global_appctx_data
+    from petsctools.testing import isolated_options
+
+    class Uncomparable:
+        # Like a NumPy array, comparison does not give a bool
+        def __eq__(self, other):
+            raise ValueError("ambiguous")
+
+    petsctools.init()
+    original = Uncomparable()
+    _global_appctx_data["uncomparable_key"] = original
+    try:
+        with isolated_options():
+            _global_appctx_data["uncomparable_key"] = Uncomparable()
+        assert _global_appctx_data["uncomparable_key"] is original
+    finally:
+        del _global_appctx_data["uncomparable_key"]
+
+
+@pytest.mark.skipnopetsc4py
+def test_clean_petsc_options_fixture(clean_petsc_options):
+    from petsc4py import PETSc
+
+    assert PETSc.Options().getAll() == {}
+    PETSc.Options()["clean_fixture_option"] = 1
+
+
+@pytest.mark.skipnopetsc4py
+@pytest.mark.filterwarnings("error")
+def test_isolated_petsc_options_fixture_does_not_reinitialise(
+    isolated_petsc_options,
+):
+    # The fixture must not call petsctools.init if PETSc is already
+    # initialised, which warns and rebuilds the command line options
+    from petsc4py import PETSc
+
+    assert PETSc.Sys.isInitialized()
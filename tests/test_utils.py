@@ -0,0 +1,32 @@
+from petsctools.utils import _WorkVecPool
+
+
+class FakeVec:
+    def getType(self):
+        return "seq"
+
+    def getSizes(self):
+        return (4, 4)
+
+    def getBlockSize(self):
+        return 1
+
+    def duplicate(self):
+        return FakeVec()
+
+
+def test_work_vec_pool_release_after():
+    pool = _WorkVecPool()
+    template = FakeVec()
+    handed_out = []
+
+    def func():
+        handed_out.append((pool.get(template), pool.get(template)))
+
+    func = pool.release_after(func)
+    func()
+    func()
+    (w1, w2), (v1, v2) = handed_out
+    assert w1 is not w2
+    assert w1 is v1 and w2 is v2
+    assert pool.checkpoint() == 0